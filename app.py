@@ -10,6 +10,22 @@ import re
 import functools
 import csv
 import io
+import zipfile
+import mimetypes
+import hashlib
+import threading
+import sqlite3
+import queue
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import collections
+import contextlib
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: fall back to in-process locking only.
+    fcntl = None
 
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -34,6 +50,13 @@ DATA_PATH = APP_ROOT / "data" / "terms.json"
 USER_TERMS_PATH = APP_ROOT / "data" / "user_terms.json"
 CUSTOM_DICT_PATH = APP_ROOT / "data" / "custom_dictionary.json"
 USERS_PATH = APP_ROOT / "data" / "users.json"
+SQLITE_PATH = APP_ROOT / "data" / "wuta.db"
+VOCAB_HISTORY_DIR = APP_ROOT / "data" / "vocab_history"
+TRANSLATION_CACHE_PATH = APP_ROOT / "data" / "translation_cache.db"
+JOBS_DIR = APP_ROOT / "data" / "jobs"
+DICTIONARY_STAMP_PATH = APP_ROOT / "data" / "dictionary.stamp"
+STATIC_DIR = APP_ROOT / "static"
+STATIC_MANIFEST_PATH = STATIC_DIR / "dist" / "manifest.json"
 AUDIO_DIR = APP_ROOT / "static" / "audio"
 
 app = Flask(__name__)
@@ -77,10 +100,66 @@ def _load_users_data() -> dict:
 
 
 def _save_users_data(payload: dict) -> None:
+    global _USERS_CACHE
     USERS_PATH.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = USERS_PATH.with_suffix(".tmp")
     tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     tmp_path.replace(USERS_PATH)
+    _USERS_CACHE = None
+
+
+_FILE_THREAD_LOCKS: dict[str, threading.Lock] = {}
+
+
+@contextlib.contextmanager
+def _locked_file(path: Path):
+    """Serialize read-modify-write cycles on path.
+
+    Threads in this process share a Lock; other gunicorn workers are excluded with an
+    flock on a sibling ".lock" file (where fcntl exists).
+    """
+    thread_lock = _FILE_THREAD_LOCKS.setdefault(str(path), threading.Lock())
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        lock_path = path.with_name(path.name + ".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+# Parsed users.json with id/username/email indexes, keyed on the file's stamp so
+# registrations handled by another worker show up on the next lookup.
+_USERS_CACHE: dict | None = None
+
+
+def _users_index() -> dict:
+    global _USERS_CACHE
+    stamp = _file_stamp(USERS_PATH)
+    cache = _USERS_CACHE
+    if cache is None or cache["stamp"] != stamp:
+        by_id: dict[str, dict] = {}
+        by_username: dict[str, dict] = {}
+        by_email: dict[str, dict] = {}
+        for u in _load_users_data().get("users", []) or []:
+            if not isinstance(u, dict):
+                continue
+            if u.get("id"):
+                by_id.setdefault(u["id"], u)
+            uname = (u.get("username") or "").lower()
+            if uname:
+                by_username.setdefault(uname, u)
+            em = _normalize_email(u.get("email") or "")
+            if em:
+                by_email.setdefault(em, u)
+        cache = {"stamp": stamp, "by_id": by_id, "by_username": by_username, "by_email": by_email}
+        _USERS_CACHE = cache
+    return cache
 
 
 def _normalize_username(username: str) -> str:
@@ -97,37 +176,21 @@ def _normalize_email(email: str) -> str:
 def _find_user_by_id(user_id: str) -> dict | None:
     if not user_id:
         return None
-    payload = _load_users_data()
-    for u in payload.get("users", []) or []:
-        if isinstance(u, dict) and u.get("id") == user_id:
-            return u
-    return None
+    return _storage().find_user_by_id(user_id)
 
 
 def _find_user_by_username(username: str) -> dict | None:
     uname = _normalize_username(username)
     if not uname:
         return None
-    payload = _load_users_data()
-    for u in payload.get("users", []) or []:
-        if not isinstance(u, dict):
-            continue
-        if (u.get("username") or "").lower() == uname.lower():
-            return u
-    return None
+    return _storage().find_user_by_username(uname)
 
 
 def _find_user_by_email(email: str) -> dict | None:
     em = _normalize_email(email)
     if not em:
         return None
-    payload = _load_users_data()
-    for u in payload.get("users", []) or []:
-        if not isinstance(u, dict):
-            continue
-        if _normalize_email(u.get("email") or "") == em:
-            return u
-    return None
+    return _storage().find_user_by_email(em)
 
 
 def _create_user(*, username: str, email: str, password: str) -> dict:
@@ -170,20 +233,98 @@ def login_required(view_func):
     return wrapper
 
 
+# Fingerprinted static assets built by tools/build_static.py (optional: without a build,
+# url_for('static', ...) and the static route behave exactly as stock Flask).
+_STATIC_MANIFEST = {"stamp": None, "files": {}, "by_path": {}}
+_STATIC_MANIFEST_LOCK = threading.Lock()
+STATIC_IMMUTABLE_MAX_AGE = 31536000
+
+
+def _static_manifest() -> dict:
+    stamp = _file_stamp(STATIC_MANIFEST_PATH)
+    if _STATIC_MANIFEST["stamp"] == stamp:
+        return _STATIC_MANIFEST
+    with _STATIC_MANIFEST_LOCK:
+        if _STATIC_MANIFEST["stamp"] != stamp:
+            files = {}
+            if stamp is not None:
+                try:
+                    files = json.loads(STATIC_MANIFEST_PATH.read_text(encoding="utf-8")).get("files") or {}
+                except (OSError, ValueError):
+                    files = {}
+            _STATIC_MANIFEST["files"] = files
+            _STATIC_MANIFEST["by_path"] = {entry["path"]: entry for entry in files.values()}
+            _STATIC_MANIFEST["stamp"] = stamp
+    return _STATIC_MANIFEST
+
+
+def _fingerprinted_static(filename: str) -> str | None:
+    """dist/ name of a static file, or None if it isn't built or changed since the build."""
+    entry = _static_manifest()["files"].get(filename)
+    if not entry:
+        return None
+    if _file_stamp(STATIC_DIR / filename) != (entry.get("source_mtime_ns"), entry.get("source_size")):
+        return None
+    return entry["path"]
+
+
+@app.url_defaults
+def _static_url_defaults(endpoint, values):
+    if endpoint == "static" and "filename" in values:
+        hashed = _fingerprinted_static(values["filename"])
+        if hashed:
+            values["filename"] = hashed
+
+
+def _serve_static(filename):
+    """Flask's static view, plus precompressed .br/.gz variants and immutable caching for dist/ names."""
+    entry = _static_manifest()["by_path"].get(filename)
+    if entry is None:
+        return app.send_static_file(filename)
+
+    path = STATIC_DIR / filename
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    encoding = None
+    for name, flag, suffix in (("br", "br", ".br"), ("gzip", "gzip", ".gz")):
+        if entry.get(flag) and request.accept_encodings[name]:
+            encoding = name
+            path = path.with_name(path.name + suffix)
+            break
+    if not path.is_file():
+        abort(404)
+    resp = send_file(path, mimetype=mimetype, max_age=STATIC_IMMUTABLE_MAX_AGE)
+    if encoding:
+        resp.content_encoding = encoding
+    resp.cache_control.immutable = True
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+app.view_functions["static"] = _serve_static
+
+
 @app.context_processor
 def _inject_current_user():
     return {"current_user": _get_current_user()}
 
 
-def _find_term_by_id(data, term_id):
+def _build_term_index(data: dict) -> dict[str, dict]:
+    """Map every term id (and legacy_id alias) to its term, first occurrence wins."""
+    idx: dict[str, dict] = {}
     for belt in data.get("belts", []):
         for term in belt.get("terms", []):
-            if term.get("id") == term_id:
-                return term
+            term_id = term.get("id")
+            if term_id:
+                idx.setdefault(term_id, term)
             # Backward compatibility: allow requesting audio using a previous id.
-            if term.get("legacy_id") == term_id:
-                return term
-    return None
+            legacy_id = term.get("legacy_id")
+            if legacy_id:
+                idx.setdefault(legacy_id, term)
+    return idx
+
+
+def _find_term_by_id(term_id):
+    return _get_vocab_snapshot()["terms_by_id"].get(term_id)
 
 
 def _get_belt_color(belt: dict) -> str:
@@ -191,6 +332,7 @@ def _get_belt_color(belt: dict) -> str:
     return (belt.get("belt_color") or BELT_COLORS.get(belt_id) or "#FFFFFF").strip()
 
 
+@functools.lru_cache(maxsize=64)
 def _is_dark_hex_color(hex_color: str) -> bool:
     """Return True if hex_color is visually dark.
 
@@ -277,8 +419,36 @@ def _save_custom_dictionary(payload: dict) -> None:
     tmp_path.replace(CUSTOM_DICT_PATH)
 
 
+# custom_dictionary.json entries with their normalized English keys, keyed on the file's
+# stamp. "by_key" maps a key to the position of its first entry, so upserts and deletes
+# are dict lookups instead of re-normalizing every entry per row.
+_CUSTOM_DICT_CACHE: dict | None = None
+
+
+def _custom_dictionary_index() -> dict:
+    global _CUSTOM_DICT_CACHE
+    stamp = _file_stamp(CUSTOM_DICT_PATH)
+    cache = _CUSTOM_DICT_CACHE
+    if cache is None or cache["stamp"] != stamp:
+        entries = [e for e in _load_custom_dictionary().get("entries", []) if isinstance(e, dict)]
+        keys = [_normalize_english_key(e.get("english") or "") for e in entries]
+        by_key: dict[str, int] = {}
+        for i, k in enumerate(keys):
+            by_key.setdefault(k, i)
+        cache = {"stamp": stamp, "entries": entries, "keys": keys, "by_key": by_key}
+        _CUSTOM_DICT_CACHE = cache
+    return cache
+
+
+def _store_custom_dictionary(entries: list[dict], keys: list[str], by_key: dict[str, int]) -> None:
+    """Write entries (caller holds the file lock) and keep the index for the new stamp."""
+    global _CUSTOM_DICT_CACHE
+    _save_custom_dictionary({"schema_version": 1, "entries": entries})
+    _CUSTOM_DICT_CACHE = {"stamp": _file_stamp(CUSTOM_DICT_PATH), "entries": entries, "keys": keys, "by_key": by_key}
+
+
 def _list_custom_dictionary_entries() -> list[dict]:
-    return _load_custom_dictionary().get("entries", [])
+    return _storage().list_dictionary_entries()
 
 
 def _admin_token_required() -> str:
@@ -294,21 +464,509 @@ def _check_admin_token() -> bool:
 
 
 def _save_user_terms_data(payload: dict) -> None:
+    global _USER_TERMS_CACHE
     USER_TERMS_PATH.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = USER_TERMS_PATH.with_suffix(".tmp")
     tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     tmp_path.replace(USER_TERMS_PATH)
+    _USER_TERMS_CACHE = None
+
+
+# Parsed user_terms.json plus an id index, keyed on the file's stamp so writes from
+# other workers are picked up too. Read-only for callers, like the vocab snapshot.
+_USER_TERMS_CACHE: dict | None = None
+
+
+def _user_terms_index() -> dict:
+    global _USER_TERMS_CACHE
+    stamp = _file_stamp(USER_TERMS_PATH)
+    cache = _USER_TERMS_CACHE
+    if cache is None or cache["stamp"] != stamp:
+        terms = [t for t in _load_user_terms_data().get("terms", []) if isinstance(t, dict)]
+        by_id: dict[str, dict] = {}
+        for t in terms:
+            if t.get("id"):
+                by_id.setdefault(t["id"], t)
+        # Per-owner lists (insertion order and newest first), so paging is a slice and
+        # counts are len(). Terms saved before accounts existed (no user_id) form the guest list.
+        by_owner: dict[str | None, list[dict]] = {}
+        for t in terms:
+            by_owner.setdefault(t.get("user_id"), []).append(t)
+        by_owner_newest = {
+            owner: sorted(owned, key=lambda t: t.get("created_at", 0), reverse=True)
+            for owner, owned in by_owner.items()
+        }
+        cache = {"stamp": stamp, "terms": terms, "by_id": by_id, "by_owner": by_owner, "by_owner_newest": by_owner_newest}
+        _USER_TERMS_CACHE = cache
+    return cache
 
 
-def _list_user_terms() -> list[dict]:
-    return _load_user_terms_data().get("terms", [])
+def _list_user_terms(owner_id: str | None) -> list[dict]:
+    """All of one owner's terms in insertion order (owner None = signed-out guests)."""
+    return _storage().list_user_terms(owner_id)
 
 
-def _find_user_term_by_id(terms: list[dict], term_id: str) -> dict | None:
-    for t in terms:
-        if t.get("id") == term_id:
-            return t
-    return None
+def _my_words_owner() -> str | None:
+    user = _get_current_user()
+    return user.get("id") if user else None
+
+
+def _find_user_term_by_id(term_id: str) -> dict | None:
+    return _storage().find_user_term(term_id)
+
+
+def _new_dictionary_entry(row: dict, now: int) -> dict:
+    return {
+        "english": row["english"],
+        "hangul": row["hangul"],
+        "romanization": row.get("romanization") or "",
+        "category": row.get("category") or "",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _apply_dictionary_update(entry: dict, row: dict, now: int) -> None:
+    entry["english"] = row["english"]
+    entry["hangul"] = row["hangul"]
+    if row.get("romanization"):
+        entry["romanization"] = row["romanization"]
+    else:
+        entry.pop("romanization", None)
+    if row.get("category"):
+        entry["category"] = row["category"]
+    else:
+        entry.pop("category", None)
+    entry["updated_at"] = now
+
+
+class JsonStorage:
+    """Default storage backend: the original data/*.json files.
+
+    Every write is a read-modify-write of the whole file under _locked_file, so it is
+    O(file size) but safe across threads and gunicorn workers.
+    """
+
+    name = "json"
+
+    # Users
+
+    def find_user_by_id(self, user_id: str) -> dict | None:
+        return _users_index()["by_id"].get(user_id)
+
+    def find_user_by_username(self, username: str) -> dict | None:
+        return _users_index()["by_username"].get(username.lower())
+
+    def find_user_by_email(self, email: str) -> dict | None:
+        return _users_index()["by_email"].get(email)
+
+    def add_user(self, new_user: dict) -> str | None:
+        """Append new_user. Returns "username" or "email" if a clashing account already exists."""
+        uname = (new_user.get("username") or "").lower()
+        em = _normalize_email(new_user.get("email") or "")
+        with _locked_file(USERS_PATH):
+            payload = _load_users_data()
+            users = payload.get("users", [])
+            if not isinstance(users, list):
+                users = []
+            for u in users:
+                if not isinstance(u, dict):
+                    continue
+                if (u.get("username") or "").lower() == uname:
+                    return "username"
+                if _normalize_email(u.get("email") or "") == em:
+                    return "email"
+            users.append(new_user)
+            payload["schema_version"] = 1
+            payload["users"] = users
+            _save_users_data(payload)
+        return None
+
+    def delete_user(self, user_id: str) -> None:
+        with _locked_file(USERS_PATH):
+            payload = _load_users_data()
+            users = payload.get("users", [])
+            if not isinstance(users, list):
+                users = []
+            payload["schema_version"] = 1
+            payload["users"] = [u for u in users if not (isinstance(u, dict) and u.get("id") == user_id)]
+            _save_users_data(payload)
+        with _locked_file(USER_TERMS_PATH):
+            payload = _load_user_terms_data()
+            terms_list = payload.get("terms", [])
+            if isinstance(terms_list, list) and any(isinstance(t, dict) and t.get("user_id") == user_id for t in terms_list):
+                payload["terms"] = [t for t in terms_list if not (isinstance(t, dict) and t.get("user_id") == user_id)]
+                payload["schema_version"] = 1
+                _save_user_terms_data(payload)
+
+    # User terms
+
+    def list_user_terms(self, owner_id: str | None) -> list[dict]:
+        return list(_user_terms_index()["by_owner"].get(owner_id, []))
+
+    def page_user_terms(self, owner_id: str | None, limit: int, offset: int = 0) -> list[dict]:
+        """One page of an owner's terms, newest first."""
+        return _user_terms_index()["by_owner_newest"].get(owner_id, [])[offset:offset + limit]
+
+    def count_user_terms(self, owner_id: str | None) -> int:
+        return len(_user_terms_index()["by_owner"].get(owner_id, []))
+
+    def find_user_term(self, term_id: str) -> dict | None:
+        return _user_terms_index()["by_id"].get(term_id)
+
+    def add_user_terms(self, new_terms: list[dict]) -> None:
+        if not new_terms:
+            return
+        with _locked_file(USER_TERMS_PATH):
+            payload = _load_user_terms_data()
+            terms_list = payload.get("terms", [])
+            if not isinstance(terms_list, list):
+                terms_list = []
+            terms_list.extend(new_terms)
+            payload["terms"] = terms_list
+            payload["schema_version"] = 1
+            _save_user_terms_data(payload)
+
+    def update_user_terms(self, changes: dict[str, dict]) -> None:
+        """Apply {term_id: {field: value}} to existing user terms."""
+        if not changes:
+            return
+        with _locked_file(USER_TERMS_PATH):
+            payload = _load_user_terms_data()
+            terms_list = payload.get("terms", [])
+            if not isinstance(terms_list, list):
+                terms_list = []
+            for t in terms_list:
+                if isinstance(t, dict) and t.get("id") in changes:
+                    t.update(changes[t["id"]])
+            payload["terms"] = terms_list
+            payload["schema_version"] = 1
+            _save_user_terms_data(payload)
+
+    def delete_user_term(self, term_id: str, owner_id: str | None) -> None:
+        with _locked_file(USER_TERMS_PATH):
+            payload = _load_user_terms_data()
+            terms_list = payload.get("terms", [])
+            if not isinstance(terms_list, list):
+                terms_list = []
+            payload["terms"] = [t for t in terms_list if not (t.get("id") == term_id and t.get("user_id") == owner_id)]
+            payload["schema_version"] = 1
+            _save_user_terms_data(payload)
+
+    # Custom dictionary
+
+    def list_dictionary_entries(self) -> list[dict]:
+        # Copies: the cached entries are shared with the index and must never be mutated.
+        return [dict(e) for e in _custom_dictionary_index()["entries"]]
+
+    def upsert_dictionary_entries(self, rows: list[dict], now: int) -> tuple[int, int]:
+        """Insert or update entries by normalized English (one write). Returns (added, updated)."""
+        if not rows:
+            return 0, 0
+        added = 0
+        updated = 0
+        with _locked_file(CUSTOM_DICT_PATH):
+            index = _custom_dictionary_index()
+            # Copy-on-write: readers of the cached index never see a half-applied import.
+            entries = list(index["entries"])
+            keys = list(index["keys"])
+            by_key = dict(index["by_key"])
+            for row in rows:
+                k = _normalize_english_key(row["english"])
+                i = by_key.get(k)
+                if i is not None:
+                    entries[i] = dict(entries[i])
+                    _apply_dictionary_update(entries[i], row, now)
+                    updated += 1
+                else:
+                    by_key[k] = len(entries)
+                    entries.append(_new_dictionary_entry(row, now))
+                    keys.append(k)
+                    added += 1
+            _store_custom_dictionary(entries, keys, by_key)
+        return added, updated
+
+    def delete_dictionary_entry(self, english: str) -> None:
+        key = _normalize_english_key(english)
+        with _locked_file(CUSTOM_DICT_PATH):
+            index = _custom_dictionary_index()
+            if key not in index["by_key"]:
+                return
+            kept = [(e, k) for e, k in zip(index["entries"], index["keys"]) if k != key]
+            entries = [e for e, _ in kept]
+            keys = [k for _, k in kept]
+            by_key: dict[str, int] = {}
+            for i, k in enumerate(keys):
+                by_key.setdefault(k, i)
+            _store_custom_dictionary(entries, keys, by_key)
+
+
+def _row_to_dict(row) -> dict:
+    # NULL columns mean "field absent" in the JSON representation.
+    return {k: row[k] for k in row.keys() if row[k] is not None}
+
+
+class SqliteStorage:
+    """SQLite storage backend (WAL mode) with indexed tables and transactional writes.
+
+    Enable with WUTA_STORAGE_BACKEND=sqlite; populate it once with `flask --app app migrate-sqlite`.
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            email TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS users_username ON users (username COLLATE NOCASE);
+        CREATE UNIQUE INDEX IF NOT EXISTS users_email ON users (email);
+
+        CREATE TABLE IF NOT EXISTS user_terms (
+            id TEXT PRIMARY KEY,
+            english TEXT NOT NULL DEFAULT '',
+            hangul TEXT NOT NULL DEFAULT '',
+            romanization TEXT,
+            category TEXT,
+            created_at INTEGER NOT NULL DEFAULT 0,
+            source TEXT,
+            user_id TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS dictionary_entries (
+            key TEXT PRIMARY KEY,
+            english TEXT NOT NULL,
+            hangul TEXT NOT NULL,
+            romanization TEXT,
+            category TEXT,
+            created_at INTEGER NOT NULL DEFAULT 0,
+            updated_at INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    _USER_TERM_COLUMNS = ("id", "english", "hangul", "romanization", "category", "created_at", "source", "user_id")
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(self._SCHEMA)
+        # Databases created before per-user My Words lack the owner column.
+        cols = {r["name"] for r in conn.execute("PRAGMA table_info(user_terms)")}
+        if "user_id" not in cols:
+            conn.execute("ALTER TABLE user_terms ADD COLUMN user_id TEXT")
+        conn.execute("DROP INDEX IF EXISTS user_terms_created_at")
+        conn.execute("CREATE INDEX IF NOT EXISTS user_terms_owner_created ON user_terms (user_id, created_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; autocommit mode so transactions are explicit.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent workers queue
+        # (up to the connection timeout) instead of failing mid-transaction.
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _one(self, sql: str, params: tuple) -> dict | None:
+        row = self._conn().execute(sql, params).fetchone()
+        return _row_to_dict(row) if row is not None else None
+
+    # Users
+
+    def find_user_by_id(self, user_id: str) -> dict | None:
+        return self._one("SELECT * FROM users WHERE id = ?", (user_id,))
+
+    def find_user_by_username(self, username: str) -> dict | None:
+        return self._one("SELECT * FROM users WHERE username = ? COLLATE NOCASE", (username,))
+
+    def find_user_by_email(self, email: str) -> dict | None:
+        return self._one("SELECT * FROM users WHERE email = ?", (email,))
+
+    def add_user(self, new_user: dict) -> str | None:
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM users WHERE username = ? COLLATE NOCASE", (new_user["username"],)).fetchone():
+                return "username"
+            if conn.execute("SELECT 1 FROM users WHERE email = ?", (new_user["email"],)).fetchone():
+                return "email"
+            conn.execute(
+                "INSERT INTO users (id, username, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)",
+                (new_user["id"], new_user["username"], new_user["email"], new_user["password_hash"], new_user.get("created_at") or 0),
+            )
+        return None
+
+    def delete_user(self, user_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+            conn.execute("DELETE FROM user_terms WHERE user_id = ?", (user_id,))
+
+    # User terms ("user_id IS ?" matches NULL for the guest list)
+
+    def list_user_terms(self, owner_id: str | None) -> list[dict]:
+        rows = self._conn().execute(
+            "SELECT * FROM user_terms WHERE user_id IS ? ORDER BY created_at, rowid", (owner_id,)
+        ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+    def page_user_terms(self, owner_id: str | None, limit: int, offset: int = 0) -> list[dict]:
+        rows = self._conn().execute(
+            "SELECT * FROM user_terms WHERE user_id IS ? ORDER BY created_at DESC, rowid LIMIT ? OFFSET ?",
+            (owner_id, limit, offset),
+        ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+    def count_user_terms(self, owner_id: str | None) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM user_terms WHERE user_id IS ?", (owner_id,)).fetchone()[0]
+
+    def find_user_term(self, term_id: str) -> dict | None:
+        return self._one("SELECT * FROM user_terms WHERE id = ?", (term_id,))
+
+    def _insert_user_term(self, conn, term: dict, verb: str = "INSERT") -> None:
+        cols = self._USER_TERM_COLUMNS
+        conn.execute(
+            f"{verb} INTO user_terms ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+            tuple(term.get(c) for c in cols),
+        )
+
+    def add_user_terms(self, new_terms: list[dict]) -> None:
+        if not new_terms:
+            return
+        with self._transaction() as conn:
+            for term in new_terms:
+                self._insert_user_term(conn, term)
+
+    def update_user_terms(self, changes: dict[str, dict]) -> None:
+        if not changes:
+            return
+        with self._transaction() as conn:
+            for term_id, fields in changes.items():
+                cols = [c for c in fields if c in self._USER_TERM_COLUMNS and c != "id"]
+                if not cols:
+                    continue
+                conn.execute(
+                    f"UPDATE user_terms SET {', '.join(f'{c} = ?' for c in cols)} WHERE id = ?",
+                    tuple(fields[c] for c in cols) + (term_id,),
+                )
+
+    def delete_user_term(self, term_id: str, owner_id: str | None) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM user_terms WHERE id = ? AND user_id IS ?", (term_id, owner_id))
+
+    # Custom dictionary
+
+    def list_dictionary_entries(self) -> list[dict]:
+        rows = self._conn().execute(
+            "SELECT english, hangul, romanization, category, created_at, updated_at FROM dictionary_entries ORDER BY rowid"
+        ).fetchall()
+        return [_row_to_dict(r) for r in rows]
+
+    def upsert_dictionary_entries(self, rows: list[dict], now: int) -> tuple[int, int]:
+        added = 0
+        updated = 0
+        with self._transaction() as conn:
+            for row in rows:
+                key = _normalize_english_key(row["english"])
+                if conn.execute("SELECT 1 FROM dictionary_entries WHERE key = ?", (key,)).fetchone():
+                    conn.execute(
+                        "UPDATE dictionary_entries SET english = ?, hangul = ?, romanization = ?, category = ?, updated_at = ? WHERE key = ?",
+                        (row["english"], row["hangul"], row.get("romanization") or None, row.get("category") or None, now, key),
+                    )
+                    updated += 1
+                else:
+                    e = _new_dictionary_entry(row, now)
+                    conn.execute(
+                        "INSERT INTO dictionary_entries (key, english, hangul, romanization, category, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (key, e["english"], e["hangul"], e["romanization"], e["category"], e["created_at"], e["updated_at"]),
+                    )
+                    added += 1
+        return added, updated
+
+    def delete_dictionary_entry(self, english: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM dictionary_entries WHERE key = ?", (_normalize_english_key(english),))
+
+
+_STORAGE = None
+_STORAGE_LOCK = threading.Lock()
+
+
+def _storage():
+    """Return the configured storage backend (WUTA_STORAGE_BACKEND=json|sqlite, default json)."""
+    global _STORAGE
+    if _STORAGE is None:
+        with _STORAGE_LOCK:
+            if _STORAGE is None:
+                backend = (os.environ.get("WUTA_STORAGE_BACKEND") or "json").strip().lower()
+                if backend == "sqlite":
+                    _STORAGE = SqliteStorage(Path((os.environ.get("WUTA_SQLITE_PATH") or "").strip() or SQLITE_PATH))
+                else:
+                    _STORAGE = JsonStorage()
+    return _STORAGE
+
+
+def _migrate_json_to_sqlite(db_path: Path) -> dict:
+    """Copy users, user terms and custom dictionary entries from the JSON files into SQLite.
+
+    Safe to re-run: rows that already exist (same id, username/email or English key) are kept.
+    """
+    store = SqliteStorage(db_path)
+    counts = {"users": 0, "user_terms": 0, "dictionary_entries": 0}
+    with store._transaction() as conn:
+        for u in _load_users_data().get("users", []) or []:
+            if not isinstance(u, dict) or not u.get("id") or not u.get("username") or not u.get("email"):
+                continue
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO users (id, username, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)",
+                (u["id"], u["username"], _normalize_email(u["email"]), u.get("password_hash") or "", u.get("created_at") or 0),
+            )
+            counts["users"] += cur.rowcount
+
+        for t in _load_user_terms_data().get("terms", []) or []:
+            if not isinstance(t, dict) or not t.get("id"):
+                continue
+            before = conn.total_changes
+            store._insert_user_term(conn, t, verb="INSERT OR IGNORE")
+            counts["user_terms"] += conn.total_changes - before
+
+        for e in _load_custom_dictionary().get("entries", []) or []:
+            if not isinstance(e, dict):
+                continue
+            key = _normalize_english_key(e.get("english") or "")
+            if not key or not e.get("hangul"):
+                continue
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO dictionary_entries (key, english, hangul, romanization, category, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, e["english"], e["hangul"], e.get("romanization"), e.get("category"), e.get("created_at") or 0, e.get("updated_at") or 0),
+            )
+            counts["dictionary_entries"] += cur.rowcount
+    return counts
+
+
+@app.cli.command("migrate-sqlite")
+def migrate_sqlite_command():
+    """Copy the JSON data files into the SQLite database (WUTA_SQLITE_PATH or data/wuta.db)."""
+    db_path = Path((os.environ.get("WUTA_SQLITE_PATH") or "").strip() or SQLITE_PATH)
+    counts = _migrate_json_to_sqlite(db_path)
+    print(f"Migrated into {db_path}: " + ", ".join(f"{v} {k}" for k, v in counts.items()))
+    print("Set WUTA_STORAGE_BACKEND=sqlite to use it.")
 
 
 def _translate_english_to_korean(english_text: str) -> str | None:
@@ -319,6 +977,8 @@ def _translate_english_to_korean(english_text: str) -> str | None:
       - dictionary (offline; uses built-in WUTA vocab only)
       - none (disable; require manual Hangul entry)
       - mymemory (online; no API key; public service, rate-limited)
+      - stub (offline fake translator for tests/dev)
+    Online providers are cached on disk (see TranslationCache).
     """
     provider = (os.environ.get("WUTA_TRANSLATION_PROVIDER") or "dictionary").strip().lower()
     text = (english_text or "").strip()
@@ -331,13 +991,86 @@ def _translate_english_to_korean(english_text: str) -> str | None:
         hit = _lookup_hangul_from_vocab(text)
         return hit or None
 
-    if provider == "mymemory":
-        return _translate_via_mymemory(text)
+    if provider in _ONLINE_TRANSLATORS:
+        return _translate_cached(text, provider)
 
     # Unknown provider
     return None
 
 
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(os.environ.get(name) or default))
+    except ValueError:
+        return default
+
+
+def _translation_concurrency() -> int:
+    """WUTA_TRANSLATION_CONCURRENCY: parallel online lookups per process (default 4)."""
+    return _env_int("WUTA_TRANSLATION_CONCURRENCY", 4)
+
+
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def _http_session() -> requests.Session:
+    """One shared keep-alive connection pool for outbound API calls (sized for the translation pool)."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=_translation_concurrency())
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second, holds at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(0.001, float(rate))
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Take one token, waiting for a refill if needed. False if that would exceed timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+_TRANSLATION_LIMITER = None
+
+
+def _translation_limiter() -> TokenBucket:
+    """Per-process limit on provider calls: WUTA_TRANSLATION_RATE/s (default 5), bursts of
+    WUTA_TRANSLATION_BURST (default 5). With several gunicorn workers, the total is per worker."""
+    global _TRANSLATION_LIMITER
+    if _TRANSLATION_LIMITER is None:
+        try:
+            rate = float(os.environ.get("WUTA_TRANSLATION_RATE") or 5)
+        except ValueError:
+            rate = 5.0
+        _TRANSLATION_LIMITER = TokenBucket(rate, _env_int("WUTA_TRANSLATION_BURST", 5))
+    return _TRANSLATION_LIMITER
+
+
 def _translate_via_mymemory(text: str) -> str | None:
     """Online English->Korean translation via MyMemory (best-effort)."""
     try:
@@ -353,7 +1086,7 @@ def _translate_via_mymemory(text: str) -> str | None:
         if email:
             params["de"] = email
 
-        resp = requests.get(
+        resp = _http_session().get(
             "https://api.mymemory.translated.net/get",
             params=params,
             timeout=8,
@@ -375,6 +1108,171 @@ def _translate_via_mymemory(text: str) -> str | None:
         return None
 
 
+def _translate_via_stub(text: str) -> str | None:
+    """Offline stand-in for an online translator (tests/dev): vocab hit, else fake Hangul.
+
+    The fake is deterministic (one syllable per letter); text without letters is a miss.
+    """
+    hit = _lookup_hangul_from_vocab(text)
+    if hit:
+        return hit
+    letters = [c for c in (text or "").lower() if "a" <= c <= "z"]
+    if not letters:
+        return None
+    # 19 initial consonants x 588 syllables each: stays inside the Hangul Syllables block.
+    return "".join(chr(0xAC00 + (ord(c) - ord("a")) % 19 * 588) for c in letters)
+
+
+# Online translation providers (WUTA_TRANSLATION_PROVIDER / WUTA_TRANSLATION_FALLBACK);
+# their results go through the persistent translation cache.
+_ONLINE_TRANSLATORS = {"mymemory": _translate_via_mymemory, "stub": _translate_via_stub}
+
+_TRANSLATION_STATS = {"hits": 0, "negative_hits": 0, "misses": 0, "rate_limited": 0, "provider_calls": 0, "provider_ms_total": 0.0, "provider_ms_max": 0.0}
+
+
+class TranslationCache:
+    """Persistent English -> Korean translation cache (SQLite, WAL), shared by all workers.
+
+    Keyed by provider and _normalize_english_key(english). Hits are kept for
+    WUTA_TRANSLATION_TTL_DAYS (default 90); misses/failures are cached too (hangul NULL)
+    for WUTA_TRANSLATION_NEGATIVE_TTL seconds (default 600) so a failing or rate-limited
+    provider isn't hammered with retries. Expired rows are purged every purge_every puts.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS translations (
+            provider TEXT NOT NULL,
+            key TEXT NOT NULL,
+            hangul TEXT,
+            created_at INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL,
+            PRIMARY KEY (provider, key)
+        );
+        CREATE INDEX IF NOT EXISTS translations_expires_at ON translations (expires_at);
+    """
+
+    def __init__(self, path: Path, purge_every: int = 500):
+        self.path = Path(path)
+        self.purge_every = purge_every
+        self._puts = itertools.count(1)
+        self._local = threading.local()
+        self._conn().executescript(self._SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, provider: str, key: str, now: int | None = None) -> tuple[bool, str | None]:
+        """(found, hangul): found is False when there's no live entry; hangul None is a cached miss."""
+        row = self._conn().execute(
+            "SELECT hangul, expires_at FROM translations WHERE provider = ? AND key = ?", (provider, key)
+        ).fetchone()
+        if row is None or row[1] <= (now if now is not None else int(time.time())):
+            return False, None
+        return True, row[0]
+
+    def put(self, provider: str, key: str, hangul: str | None, ttl: int, now: int | None = None) -> None:
+        now = now if now is not None else int(time.time())
+        self._conn().execute(
+            "INSERT OR REPLACE INTO translations (provider, key, hangul, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (provider, key, hangul, now, now + ttl),
+        )
+        if next(self._puts) % self.purge_every == 0:
+            self.purge_expired(now)
+
+    def purge_expired(self, now: int | None = None) -> int:
+        now = now if now is not None else int(time.time())
+        return self._conn().execute("DELETE FROM translations WHERE expires_at <= ?", (now,)).rowcount
+
+    def counts(self) -> dict:
+        row = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(hangul IS NULL), 0) FROM translations WHERE expires_at > ?", (int(time.time()),)
+        ).fetchone()
+        return {"entries": row[0], "negative_entries": row[1]}
+
+
+_TRANSLATION_CACHE = None
+_TRANSLATION_CACHE_LOCK = threading.Lock()
+
+
+def _translation_cache() -> TranslationCache:
+    global _TRANSLATION_CACHE
+    if _TRANSLATION_CACHE is None:
+        with _TRANSLATION_CACHE_LOCK:
+            if _TRANSLATION_CACHE is None:
+                path = (os.environ.get("WUTA_TRANSLATION_CACHE_PATH") or "").strip() or TRANSLATION_CACHE_PATH
+                _TRANSLATION_CACHE = TranslationCache(Path(path))
+    return _TRANSLATION_CACHE
+
+
+def _translation_ttls() -> tuple[int, int]:
+    try:
+        ttl = int(float(os.environ.get("WUTA_TRANSLATION_TTL_DAYS") or 90) * 86400)
+    except ValueError:
+        ttl = 90 * 86400
+    try:
+        negative_ttl = int(os.environ.get("WUTA_TRANSLATION_NEGATIVE_TTL") or 600)
+    except ValueError:
+        negative_ttl = 600
+    return max(1, ttl), max(1, negative_ttl)
+
+
+def _translate_cached(text: str, provider: str) -> str | None:
+    """Translate with an online provider, going through the persistent cache."""
+    key = _normalize_english_key(text)
+    translate = _ONLINE_TRANSLATORS.get(provider)
+    if not key or translate is None:
+        return None
+    try:
+        cache = _translation_cache()
+        found, hangul = cache.get(provider, key)
+    except sqlite3.Error as e:
+        print(f"Translation cache unavailable: {e}")
+        cache, found, hangul = None, False, None
+    if found:
+        _TRANSLATION_STATS["hits" if hangul else "negative_hits"] += 1
+        return hangul
+
+    _TRANSLATION_STATS["misses"] += 1
+    if not _translation_limiter().acquire(timeout=30):
+        # Not the provider's answer, so nothing is cached; a later attempt may succeed.
+        _TRANSLATION_STATS["rate_limited"] += 1
+        return None
+    started = time.perf_counter()
+    hangul = translate(text) or None
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _TRANSLATION_STATS["provider_calls"] += 1
+    _TRANSLATION_STATS["provider_ms_total"] += elapsed_ms
+    _TRANSLATION_STATS["provider_ms_max"] = max(_TRANSLATION_STATS["provider_ms_max"], elapsed_ms)
+
+    if cache is not None:
+        ttl, negative_ttl = _translation_ttls()
+        try:
+            cache.put(provider, key, hangul, ttl if hangul else negative_ttl)
+        except sqlite3.Error as e:
+            print(f"Error caching translation for {key!r}: {e}")
+    return hangul
+
+
+def _translation_stats() -> dict:
+    stats = dict(_TRANSLATION_STATS)
+    calls = stats["provider_calls"]
+    stats["provider_ms_avg"] = round(stats["provider_ms_total"] / calls, 1) if calls else 0.0
+    stats["provider_ms_total"] = round(stats["provider_ms_total"], 1)
+    stats["provider_ms_max"] = round(stats["provider_ms_max"], 1)
+    try:
+        stats.update(_translation_cache().counts())
+    except sqlite3.Error:
+        pass
+    return stats
+
+
 _HANGUL_RE = re.compile(r"[\u1100-\u11FF\u3130-\u318F\uAC00-\uD7A3]")
 
 
@@ -403,62 +1301,175 @@ def _normalize_english_key(text: str) -> str:
     return s
 
 
-@functools.lru_cache(maxsize=4)
-def _english_to_hangul_index(data_mtime: float) -> dict[str, str]:
-    """Build a lookup of normalized English -> Hangul using the canonical vocab dataset."""
-    try:
-        data = load_data()
-    except Exception:
-        return {}
+class HangulIndex:
+    """Normalized English -> Hangul lookup: the canonical terms.json layer plus the admin
+    custom dictionary layer (custom entries override canonical ones).
+
+    The canonical layer is rebuilt only when the vocabulary version changes. Admin saves,
+    deletes and imports patch the custom layer in place and bump a counter in a shared
+    stamp file; other gunicorn workers see the counter change on their next lookup and
+    reload just the custom layer.
+    """
+
+    def __init__(self, stamp_path: Path):
+        self.stamp_path = Path(stamp_path)
+        self._lock = threading.Lock()
+        self._canonical_version = None
+        self._canonical: dict[str, str] = {}
+        self._custom: dict[str, str] = {}
+        self._custom_loaded = False
+        self._merged: dict[str, str] = {}
+        # What this process last synced with: the stamp counter and custom_dictionary.json's stamp.
+        self._seen_counter = None
+        self._seen_source_stamp = None
+        self.stats = {"canonical_builds": 0, "custom_reloads": 0, "incremental_updates": 0}
+
+    def lookup(self, english: str) -> str:
+        key = _normalize_english_key(english)
+        if not key:
+            return ""
+        self._refresh()
+        return self._merged.get(key, "")
+
+    def upsert(self, rows: list[dict]) -> None:
+        """Apply saved {english, hangul} rows to this worker's index and tell the others."""
+        self._changed({_normalize_english_key(r.get("english") or ""): _clean_korean_candidate(r.get("hangul") or "") for r in rows})
+
+    def delete(self, english: str) -> None:
+        self._changed({_normalize_english_key(english): ""})
+
+    def __len__(self) -> int:
+        return len(self._merged)
+
+    def _changed(self, changes: dict[str, str]) -> None:
+        # Call after the storage write: any worker that reloads from here on sees it.
+        with self._lock:
+            if self._custom_loaded:
+                for key, hangul in changes.items():
+                    if not key:
+                        continue
+                    if _has_hangul(hangul):
+                        self._custom[key] = self._merged[key] = hangul
+                    elif key in self._canonical:
+                        self._custom.pop(key, None)
+                        self._merged[key] = self._canonical[key]
+                    else:
+                        self._custom.pop(key, None)
+                        self._merged.pop(key, None)
+                self.stats["incremental_updates"] += 1
+            with _locked_file(self.stamp_path):
+                counter = self._read_counter()
+                # Our patched layer is only current if no other worker bumped the stamp
+                # since we last synced; otherwise the next lookup reloads it.
+                in_sync = self._custom_loaded and counter == self._seen_counter
+                self.stamp_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.stamp_path.with_name(f"{self.stamp_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+                tmp_path.write_text(str(counter + 1), encoding="utf-8")
+                tmp_path.replace(self.stamp_path)
+                self._seen_counter = counter + 1 if in_sync else None
+                # Our own write to custom_dictionary.json is already applied above.
+                self._seen_source_stamp = self._source_stamp()
+
+    def _read_counter(self) -> int:
+        try:
+            return int(self.stamp_path.read_text(encoding="utf-8").strip() or 0)
+        except (OSError, ValueError):
+            return 0
 
-    idx: dict[str, str] = {}
-    for belt in (data or {}).get("belts", []) or []:
-        for term in (belt or {}).get("terms", []) or []:
-            if not isinstance(term, dict):
+    def _source_stamp(self):
+        # Hand edits of custom_dictionary.json are noticed too (JSON backend only).
+        return _file_stamp(CUSTOM_DICT_PATH) if _storage().name == "json" else None
+
+    def _refresh(self) -> None:
+        try:
+            version = _get_vocab_snapshot()["version"]
+        except Exception:
+            version = ""
+        # Read the counter itself rather than stat the file: it is a few bytes, and two
+        # quick bumps can leave the same (mtime_ns, size) on coarse-mtime filesystems.
+        counter = self._read_counter()
+        source_stamp = self._source_stamp()
+        if (
+            version == self._canonical_version
+            and self._custom_loaded
+            and counter == self._seen_counter
+            and source_stamp == self._seen_source_stamp
+        ):
+            return
+        with self._lock:
+            if version != self._canonical_version:
+                self._canonical = self._build_canonical()
+                self._canonical_version = version
+                self.stats["canonical_builds"] += 1
+                self._merged = {**self._canonical, **self._custom}
+            if counter != self._seen_counter or source_stamp != self._seen_source_stamp or not self._custom_loaded:
+                self._custom = self._build_custom()
+                self._custom_loaded = True
+                self.stats["custom_reloads"] += 1
+                self._merged = {**self._canonical, **self._custom}
+                self._seen_counter = counter
+                self._seen_source_stamp = source_stamp
+
+    @staticmethod
+    def _build_canonical() -> dict[str, str]:
+        try:
+            data = _get_vocab_snapshot()["data"]
+        except Exception:
+            return {}
+
+        idx: dict[str, str] = {}
+        for belt in (data or {}).get("belts", []) or []:
+            for term in (belt or {}).get("terms", []) or []:
+                if not isinstance(term, dict):
+                    continue
+                eng = (term.get("english") or "").strip()
+                hangul = _clean_korean_candidate(term.get("hangul") or "")
+                if not eng or not _has_hangul(hangul):
+                    continue
+                key = _normalize_english_key(eng)
+                if not key:
+                    continue
+                # First write wins so we keep the earliest canonical mapping.
+                idx.setdefault(key, hangul)
+        return idx
+
+    @staticmethod
+    def _build_custom() -> dict[str, str]:
+        try:
+            custom_entries = _list_custom_dictionary_entries()
+        except Exception:
+            custom_entries = []
+
+        idx: dict[str, str] = {}
+        for e in custom_entries or []:
+            if not isinstance(e, dict):
                 continue
-            eng = (term.get("english") or "").strip()
-            hangul = _clean_korean_candidate(term.get("hangul") or "")
+            eng = (e.get("english") or "").strip()
+            hangul = _clean_korean_candidate(e.get("hangul") or "")
             if not eng or not _has_hangul(hangul):
                 continue
             key = _normalize_english_key(eng)
-            if not key:
-                continue
-            # First write wins so we keep the earliest canonical mapping.
-            idx.setdefault(key, hangul)
+            if key:
+                idx[key] = hangul
+        return idx
 
-    # Layer in admin-managed custom dictionary entries (override canonical if needed).
-    try:
-        custom_payload = _load_custom_dictionary()
-        custom_entries = custom_payload.get("entries", []) if isinstance(custom_payload, dict) else []
-    except Exception:
-        custom_entries = []
 
-    for e in custom_entries or []:
-        if not isinstance(e, dict):
-            continue
-        eng = (e.get("english") or "").strip()
-        hangul = _clean_korean_candidate(e.get("hangul") or "")
-        if not eng or not _has_hangul(hangul):
-            continue
-        key = _normalize_english_key(eng)
-        if not key:
-            continue
-        # Custom entries override canonical.
-        idx[key] = hangul
-    return idx
+_HANGUL_INDEX = None
+_HANGUL_INDEX_LOCK = threading.Lock()
+
+
+def _hangul_index() -> HangulIndex:
+    global _HANGUL_INDEX
+    if _HANGUL_INDEX is None:
+        with _HANGUL_INDEX_LOCK:
+            if _HANGUL_INDEX is None:
+                _HANGUL_INDEX = HangulIndex(DICTIONARY_STAMP_PATH)
+    return _HANGUL_INDEX
 
 
 def _lookup_hangul_from_vocab(english: str) -> str:
-    """Return Hangul from built-in vocab for an English phrase, else empty string."""
-    key = _normalize_english_key(english)
-    if not key:
-        return ""
-    try:
-        mtime = DATA_PATH.stat().st_mtime
-    except Exception:
-        mtime = 0.0
-    idx = _english_to_hangul_index(mtime)
-    return idx.get(key, "")
+    """Return Hangul from built-in vocab (or the custom dictionary) for an English phrase, else empty string."""
+    return _hangul_index().lookup(english)
 
 
 def _best_effort_hangul_for_english(english: str) -> str:
@@ -474,159 +1485,1315 @@ def _best_effort_hangul_for_english(english: str) -> str:
     fallback = (os.environ.get("WUTA_TRANSLATION_FALLBACK") or "").strip().lower()
 
     translated = ""
-    if provider == "mymemory":
-        translated = _translate_via_mymemory(english) or ""
-    elif provider in {"dictionary", "dict", "local", "offline"} and fallback in {"mymemory"}:
-        translated = _translate_via_mymemory(english) or ""
+    if provider in _ONLINE_TRANSLATORS:
+        translated = _translate_cached(english, provider) or ""
+    elif provider in {"dictionary", "dict", "local", "offline"} and fallback in _ONLINE_TRANSLATORS:
+        translated = _translate_cached(english, fallback) or ""
     else:
         # Any other provider types: keep legacy behavior (if configured).
         translated = _translate_english_to_korean(english) or ""
 
-    translated = _clean_korean_candidate(translated)
-    return translated if _has_hangul(translated) else ""
+    translated = _clean_korean_candidate(translated)
+    return translated if _has_hangul(translated) else ""
+
+
+_TRANSLATION_POOL = None
+_TRANSLATION_POOL_LOCK = threading.Lock()
+
+
+def _translation_pool() -> ThreadPoolExecutor:
+    # Shared by all requests, so concurrent imports together stay within the bound.
+    global _TRANSLATION_POOL
+    if _TRANSLATION_POOL is None:
+        with _TRANSLATION_POOL_LOCK:
+            if _TRANSLATION_POOL is None:
+                _TRANSLATION_POOL = ThreadPoolExecutor(max_workers=_translation_concurrency(), thread_name_prefix="wuta-translate")
+    return _TRANSLATION_POOL
+
+
+def _translate_batch(phrases: list[str]):
+    """Translate many English phrases; yields (index, hangul or "") as each result is ready.
+
+    Phrases that normalize to the same key are looked up once. Vocabulary/dictionary hits
+    are yielded straight away; the rest go through the shared thread pool, where online
+    lookups are cached and rate-limited (see _translate_cached).
+    """
+    by_key: dict[str, list[int]] = {}
+    for i, phrase in enumerate(phrases):
+        key = _normalize_english_key(phrase)
+        if not key:
+            yield i, ""
+            continue
+        by_key.setdefault(key, []).append(i)
+
+    remaining = {}
+    for key, indexes in by_key.items():
+        hit = _lookup_hangul_from_vocab(phrases[indexes[0]])
+        if hit:
+            for i in indexes:
+                yield i, hit
+        else:
+            remaining[key] = indexes
+    if not remaining:
+        return
+
+    pool = _translation_pool()
+    futures = {pool.submit(_best_effort_hangul_for_english, phrases[indexes[0]]): indexes for indexes in remaining.values()}
+    for fut in as_completed(futures):
+        try:
+            hangul = fut.result() or ""
+        except Exception as e:
+            print(f"Error translating {phrases[futures[fut][0]]!r}: {e}")
+            hangul = ""
+        for i in futures[fut]:
+            yield i, hangul
+
+
+def _create_user_term(*, english: str, hangul: str, romanization: str | None = None, category: str | None = None, owner_id: str | None = None) -> dict:
+    now = int(time.time())
+    term = {
+        "id": f"u_{uuid.uuid4().hex}",
+        "english": (english or "").strip(),
+        "hangul": (hangul or "").strip(),
+        "romanization": (romanization or "").strip(),
+        "category": (category or "User") .strip() or "User",
+        "created_at": now,
+        "source": "user",
+    }
+    if owner_id:
+        term["user_id"] = owner_id
+    return term
+
+
+def _load_audio_meta(meta_path: Path):
+    try:
+        if not meta_path.exists():
+            return None
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _write_audio_meta(meta_path: Path, payload: dict):
+    meta_path.parent.mkdir(parents=True, exist_ok=True)
+    meta_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _stub_tts_mp3(text: str, slow: bool = False) -> bytes:
+    """Offline TTS stand-in: silent MP3 whose length scales with the text.
+
+    Frames are MPEG-2 Layer III, 32 kbps, 24 kHz mono (the encoding gTTS returns);
+    all-zero side info decodes as silence.
+    """
+    frame = b"\xff\xf3\x44\xc0" + bytes(92)
+    count = max(4, len(text or "") * (3 if slow else 2))
+    return frame * count
+
+
+def _tts_mp3_bytes(text: str, lang: str, slow: bool = False) -> bytes:
+    """Synthesize text to MP3 bytes with the configured provider.
+
+    WUTA_TTS_PROVIDER: gtts (default, online) or stub (offline silence, for tests/dev).
+    """
+    provider = (os.environ.get("WUTA_TTS_PROVIDER") or "gtts").strip().lower()
+    _AUDIO_STATS["tts_calls"] += 1
+    if provider == "stub":
+        return _stub_tts_mp3(text, slow)
+    buf = io.BytesIO()
+    gTTS(text=text, lang=lang, slow=slow).write_to_fp(buf)
+    return buf.getvalue()
+
+
+# Audio modes served by /audio/<term_id>?mode=....
+_AUDIO_MODES = ("bilingual", "korean", "english")
+_AUDIO_MODE_SUFFIX = {"bilingual": "", "korean": ".ko", "english": ".en"}
+
+# Tracks are content-addressed: the cache key hashes exactly what gets spoken (text,
+# language, slow flag per segment; the prompt template is rendered into the English
+# text) plus the pause length. Identical phrases share one file, and editing a term's
+# Hangul/English changes its key, so only that clip is regenerated.
+# Bump _AUDIO_SCHEMA_VERSION when the way tracks are assembled changes.
+_AUDIO_SCHEMA_VERSION = 4
+_AUDIO_PROMPT_TEMPLATE = "The word is {english}."
+_AUDIO_PAUSE_MS = 650
+_AUDIO_TRACK_MEMO: dict[tuple, dict] = {}
+_AUDIO_TRACK_MEMO_MAX = 5000
+
+
+def _normalize_audio_mode(mode: str | None) -> str:
+    m = (mode or "bilingual").strip().lower()
+    if m in {"korean", "ko", "korean_only"}:
+        return "korean"
+    if m in {"english", "en", "english_only"}:
+        return "english"
+    return "bilingual"
+
+
+def _audio_plan(term: dict, mode: str) -> dict:
+    """Describe the segments to speak for term in mode, from the term's stored fields only.
+
+    A term without Hangul gets a {"translate": english} Korean segment (plus the
+    romanization "fallback" segment, if any); _resolve_audio_plan translates it inside
+    the generation job, so building the cache key never waits on the network.
+    Raises ValueError for Korean-only mode when there's neither Hangul nor English.
+    """
+    english = (term.get("english") or "").strip()
+    hangul = _clean_korean_candidate(term.get("hangul") or "")
+    romanization = (term.get("romanization") or "").strip()
+
+    # English first: include a short prompt for clarity.
+    # Example: "The word is Front Kick."
+    english_prompt = _AUDIO_PROMPT_TEMPLATE.format(english=english) if english else ""
+    english_segment = {"text": english_prompt or english or hangul, "lang": "en", "slow": False}
+
+    if mode == "english":
+        return {"schema": _AUDIO_SCHEMA_VERSION, "segments": [english_segment], "pause_ms": 0}
+
+    # Korean stays slow for learning.
+    # IMPORTANT: never feed English into a Korean voice (sounds like a "Korean accent").
+    # Last-resort fallback: speak romanization with an English voice so it doesn't sound like a bad "translation".
+    romanization_segment = {"text": romanization, "lang": "en", "slow": False} if romanization else None
+    if _has_hangul(hangul):
+        korean_segment = {"text": hangul, "lang": "ko", "slow": True}
+    elif english:
+        korean_segment = {"translate": english, "lang": "ko", "slow": True, "fallback": romanization_segment}
+    else:
+        korean_segment = None
+
+    if mode == "korean":
+        if korean_segment is None:
+            raise ValueError("No valid Hangul available for Korean-only audio")
+        if "translate" in korean_segment:
+            korean_segment = {**korean_segment, "fallback": None}
+        return {"schema": _AUDIO_SCHEMA_VERSION, "segments": [korean_segment], "pause_ms": 0}
+
+    if korean_segment is None:
+        korean_segment = romanization_segment
+    if korean_segment is None:
+        return {"schema": _AUDIO_SCHEMA_VERSION, "segments": [english_segment], "pause_ms": 0}
+    return {"schema": _AUDIO_SCHEMA_VERSION, "segments": [english_segment, korean_segment], "pause_ms": _AUDIO_PAUSE_MS}
+
+
+def _audio_track(term: dict, mode: str) -> dict:
+    """Return {"key", "plan"} for term in mode, memoized per term content."""
+    memo_key = (mode, term.get("english"), term.get("hangul"), term.get("romanization"))
+    track = _AUDIO_TRACK_MEMO.get(memo_key)
+    if track is not None:
+        return track
+    plan = _audio_plan(term, mode)
+    blob = json.dumps([plan["schema"], plan["segments"], plan["pause_ms"]], ensure_ascii=False, sort_keys=True)
+    track = {"key": hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32], "plan": plan}
+    if len(_AUDIO_TRACK_MEMO) >= _AUDIO_TRACK_MEMO_MAX:
+        _AUDIO_TRACK_MEMO.clear()
+    _AUDIO_TRACK_MEMO[memo_key] = track
+    return track
+
+
+def _resolve_audio_plan(plan: dict) -> tuple[dict, bool]:
+    """Translate the plan's {"translate": ...} segments. Returns (plan, complete).
+
+    complete is False when a translation failed and its fallback (or nothing) was used
+    instead; such a result must not be stored under the track's key.
+    Raises ValueError if no segment is left to speak.
+    """
+    segments = []
+    complete = True
+    for seg in plan["segments"]:
+        if "translate" in seg:
+            hangul = _best_effort_hangul_for_english(seg["translate"])
+            if _has_hangul(hangul):
+                seg = {"text": hangul, "lang": seg["lang"], "slow": seg["slow"]}
+            else:
+                complete = False
+                seg = seg.get("fallback")
+                if seg is None:
+                    continue
+        segments.append(seg)
+    if not segments:
+        raise ValueError("No valid Hangul available for Korean-only audio")
+    return {**plan, "segments": segments}, complete
+
+
+def _audio_track_path(key: str) -> Path:
+    return AUDIO_DIR / "tracks" / key[:2] / f"{key}.mp3"
+
+
+def _audio_versions(terms: list[dict]) -> dict[str, dict[str, str]]:
+    """Map term id -> {mode: track key} for the ?v= cache-busting parameter on /audio URLs.
+
+    Keys come from stored fields only, so this never waits on a translation.
+    """
+    versions = {}
+    for term in terms:
+        if not term.get("id"):
+            continue
+        keys = {}
+        for mode in _AUDIO_MODES:
+            try:
+                keys[mode] = _audio_track(term, mode)["key"]
+            except ValueError:
+                continue
+        if keys:
+            versions[term["id"]] = keys
+    return versions
+
+
+def _audio_clip_key(segment: dict) -> str:
+    blob = json.dumps([segment["text"], segment["lang"], bool(segment["slow"])], ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+def _audio_clip_path(key: str) -> Path:
+    return AUDIO_DIR / "clips" / key[:2] / f"{key}.mp3"
+
+
+def _audio_pointer_path(term_id: str, mode: str) -> Path:
+    # term_id -> cache key of the last track generated for it (used as a fallback while
+    # an edited term's new track is pending, and by tooling).
+    return AUDIO_DIR / "by_term" / f"{term_id}{_AUDIO_MODE_SUFFIX[mode]}.json"
+
+
+def _previous_audio_track(term_id: str, mode: str) -> Path | None:
+    pointer = _load_audio_meta(_audio_pointer_path(term_id, mode))
+    if not pointer or not pointer.get("key"):
+        return None
+    path = _audio_track_path(pointer["key"])
+    return path if path.exists() else None
+
+
+def _purge_legacy_audio() -> int:
+    """Delete the per-term files of the old audio layout (static/audio/<term_id>[_mode].mp3
+    and their .meta.json sidecars). Nothing reads them since tracks became content-addressed;
+    sfx/ and the tracks/clips/by_term/bundles directories are left alone. Returns the count.
+    """
+    removed = 0
+    if not AUDIO_DIR.is_dir():
+        return 0
+    for path in AUDIO_DIR.iterdir():
+        if path.is_file() and (path.suffix == ".mp3" or path.name.endswith(".meta.json")):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+@app.cli.command("purge-legacy-audio")
+def purge_legacy_audio_command():
+    """Remove per-term audio left over from before the content-addressed audio cache."""
+    print(f"Removed {_purge_legacy_audio()} legacy audio files from {AUDIO_DIR}")
+
+
+def _audio_is_ready(term: dict, mode: str) -> bool:
+    try:
+        return _audio_track_path(_audio_track(term, mode)["key"]).exists()
+    except ValueError:
+        # Nothing to generate for this mode (e.g. no Hangul for Korean-only).
+        return True
+
+
+def _ensure_audio_clip(segment: dict) -> bytes:
+    """Return the raw TTS clip for one segment, synthesizing it only if it isn't cached.
+
+    Clips are shared by every track that speaks the same segment, so the bilingual,
+    Korean-only and English-only tracks of a term cost two TTS calls in total.
+    """
+    key = _audio_clip_key(segment)
+    clip_file = _audio_clip_path(key)
+    try:
+        data = clip_file.read_bytes()
+        _AUDIO_STATS["clip_hits"] += 1
+        return data
+    except FileNotFoundError:
+        pass
+    with _audio_single_flight(f"clip-{key}", _audio_lock_timeout()):
+        try:
+            data = clip_file.read_bytes()
+            _AUDIO_STATS["clip_hits"] += 1
+            return data
+        except FileNotFoundError:
+            pass
+        data = _tts_mp3_bytes(segment["text"], segment["lang"], slow=segment["slow"])
+        clip_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = clip_file.with_name(f"{key}.{uuid.uuid4().hex[:8]}.tmp.mp3")
+        try:
+            tmp_file.write_bytes(data)
+            tmp_file.replace(clip_file)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
+        return data
+
+
+# MPEG audio header tables (kbps / Hz), keyed by (MPEG version 1 or 2, layer) and version.
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 25: (11025, 12000, 8000)}
+
+
+def _mp3_frame_info(header: bytes) -> dict | None:
+    """Decode a 4-byte MPEG audio frame header, or None if it isn't one we can splice."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version = {0: 25, 2: 2, 3: 1}.get((header[1] >> 3) & 3)
+    layer = {1: 3, 2: 2, 3: 1}.get((header[1] >> 1) & 3)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    # Free-format (index 0) frames have no computable length; leave those to pydub.
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    if layer == 1:
+        length, samples = (12 * bitrate // sample_rate + padding) * 4, 384
+    elif layer == 3 and version != 1:
+        length, samples = 72 * bitrate // sample_rate + padding, 576
+    else:
+        length, samples = 144 * bitrate // sample_rate + padding, 1152
+    mono = (header[3] >> 6) == 3
+    return {"length": length, "samples": samples, "encoding": (version, layer, sample_rate, mono)}
+
+
+def _mp3_frames(data: bytes) -> list[tuple[bytes, dict]] | None:
+    """Split an MP3 into its audio frames, dropping ID3 tags and Xing/Info/VBRI headers.
+
+    Returns None if the stream doesn't parse cleanly (the caller then falls back to pydub).
+    """
+    frames = []
+    pos, end = 0, len(data)
+    if end >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    while pos + 4 <= end:
+        if data[pos:pos + 3] == b"ID3" and pos + 10 <= end:
+            # gTTS may return several concatenated parts, each with its own tag.
+            size = (data[pos + 6] & 0x7F) << 21 | (data[pos + 7] & 0x7F) << 14 | (data[pos + 8] & 0x7F) << 7 | (data[pos + 9] & 0x7F)
+            pos += 10 + size + (10 if data[pos + 5] & 0x10 else 0)
+            continue
+        info = _mp3_frame_info(data[pos:pos + 4])
+        if info is None:
+            return None
+        if pos + info["length"] > end:
+            break  # truncated last frame
+        frame = data[pos:pos + info["length"]]
+        pos += info["length"]
+        if not frames and any(tag in frame[4:48] for tag in (b"Xing", b"Info", b"VBRI")):
+            # The VBR header describes the original file's length; it would be wrong for the joined track.
+            continue
+        frames.append((frame, info))
+    return frames or None
+
+
+def _mp3_silence(template: bytes, info: dict, pause_ms: int) -> bytes:
+    """Encoded silence for pause_ms at the template frame's sample rate, bitrate and channels.
+
+    An unpadded frame with no CRC and all-zero side info/main data decodes as silence.
+    """
+    header = bytes([template[0], template[1] | 0x01, template[2] & ~0x02 & 0xFF, template[3]])
+    length = _mp3_frame_info(header)["length"]
+    sample_rate = info["encoding"][2]
+    count = -(-pause_ms * sample_rate // (1000 * info["samples"]))
+    return (header + bytes(length - 4)) * count
+
+
+def _concat_mp3_clips(clips: list[bytes], pause_ms: int) -> bytes | None:
+    """Join MP3 clips frame by frame with encoded silence between them, without re-encoding.
+
+    Returns None when the clips can't be spliced (different sample rates/layers/channels
+    or unparseable data).
+    """
+    parsed = [_mp3_frames(clip) for clip in clips]
+    if any(frames is None for frames in parsed):
+        return None
+    if len({info["encoding"] for frames in parsed for _, info in frames}) != 1:
+        return None
+    out = bytearray()
+    for i, frames in enumerate(parsed):
+        if i and pause_ms > 0:
+            out += _mp3_silence(frames[0][0], frames[0][1], pause_ms)
+        for frame, _ in frames:
+            out += frame
+    return bytes(out)
+
+
+def _render_audio_plan(plan: dict, out_path: Path) -> None:
+    """Assemble the plan's cached segment clips, joined with its pause, into out_path."""
+    clips = [_ensure_audio_clip(seg) for seg in plan["segments"]]
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if len(clips) == 1:
+        out_path.write_bytes(clips[0])
+        return
+
+    joined = _concat_mp3_clips(clips, plan["pause_ms"])
+    if joined is not None:
+        out_path.write_bytes(joined)
+        return
+
+    # Segments encoded differently: decode and re-encode through pydub/ffmpeg.
+    _AUDIO_STATS["pydub_fallbacks"] += 1
+    from pydub import AudioSegment
+
+    combined = AudioSegment.from_mp3(io.BytesIO(clips[0]))
+    for clip in clips[1:]:
+        combined = combined + AudioSegment.silent(duration=plan["pause_ms"]) + AudioSegment.from_mp3(io.BytesIO(clip))
+    combined.export(str(out_path), format="mp3")
+
+
+def _audio_lock_timeout() -> float:
+    try:
+        return max(1.0, float(os.environ.get("WUTA_AUDIO_LOCK_TIMEOUT") or 60))
+    except ValueError:
+        return 60.0
+
+
+@contextlib.contextmanager
+def _audio_single_flight(name: str, timeout: float, stale_after: float = 180.0):
+    """Hold the cross-process generation lock for one audio track.
+
+    Uses flock on AUDIO_DIR/.locks/<name>.lock, which the kernel releases if the holder
+    dies, so a crashed worker can't wedge a track. Without fcntl, falls back to an
+    O_EXCL lock file that is broken once older than stale_after seconds.
+    Raises TimeoutError if another holder keeps it longer than timeout.
+    """
+    lock_dir = AUDIO_DIR / ".locks"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    lock_path = lock_dir / f"{name}.lock"
+    deadline = time.monotonic() + timeout
+
+    if fcntl is not None:
+        with open(lock_path, "a") as fh:
+            while True:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"audio generation for {name} is still running elsewhere")
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        return
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, f"{os.getpid()} {int(time.time())}".encode("ascii"))
+            os.close(fd)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_after:
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"audio generation for {name} is still running elsewhere")
+            time.sleep(0.1)
+    try:
+        yield
+    finally:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _ensure_audio(term_id: str, term: dict, mode: str) -> Path:
+    """Generate the track for term in mode if it isn't cached yet. Returns the path to serve.
+
+    Only one thread across all workers generates a given track; the others wait for it
+    and then reuse the result. If bilingual assembly fails, falls back to the
+    Korean-only track so the app still works. Raises if nothing playable could be produced.
+    """
+    track = _audio_track(term, mode)
+    audio_file = _audio_track_path(track["key"])
+    if not audio_file.exists():
+        with _audio_single_flight(track["key"], _audio_lock_timeout()):
+            # Someone else may have finished it while we waited for the lock.
+            if not audio_file.exists():
+                # Unique temp names so an overlapping writer can never interleave into our file.
+                tmp_file = audio_file.with_name(f"{track['key']}.{uuid.uuid4().hex[:8]}.tmp.mp3")
+                try:
+                    plan, complete = _resolve_audio_plan(track["plan"])
+                    if not complete:
+                        # Translation failed: serve a stand-in (stored under its own key)
+                        # and try again on the next request.
+                        return _ensure_fallback_audio(plan)
+                    _render_audio_plan(plan, tmp_file)
+                    tmp_file.replace(audio_file)
+                except Exception as e:
+                    try:
+                        if tmp_file.exists():
+                            tmp_file.unlink()
+                    except Exception:
+                        pass
+                    if mode != "bilingual":
+                        raise
+                    print(f"Error generating bilingual audio for {term_id}: {e}")
+                    return _ensure_audio(term_id, term, "korean")
+
+    try:
+        _write_audio_meta(
+            _audio_pointer_path(term_id, mode),
+            {"key": track["key"], "mode": mode, "schema_version": _AUDIO_SCHEMA_VERSION},
+        )
+    except Exception:
+        pass
+    return audio_file
+
+
+def _ensure_fallback_audio(plan: dict) -> Path:
+    """Render a resolved plan under a key of its own content (not the term's track key)."""
+    blob = json.dumps([plan["schema"], plan["segments"], plan["pause_ms"]], ensure_ascii=False, sort_keys=True)
+    key = hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+    path = _audio_track_path(key)
+    if not path.exists():
+        with _audio_single_flight(key, _audio_lock_timeout()):
+            if not path.exists():
+                tmp_file = path.with_name(f"{key}.{uuid.uuid4().hex[:8]}.tmp.mp3")
+                try:
+                    _render_audio_plan(plan, tmp_file)
+                    tmp_file.replace(path)
+                finally:
+                    if tmp_file.exists():
+                        tmp_file.unlink()
+    return path
+
+
+# Background audio generation: a small pool of daemon threads fed by a priority queue.
+# Jobs are deduplicated by track cache key, so terms with the same spoken content share
+# one job; callers get a Future they can wait on.
+# Requests (priority 0) jump ahead of pre-generation sweeps (priority 1).
+_AUDIO_QUEUE: queue.PriorityQueue = queue.PriorityQueue()
+_AUDIO_JOBS: dict[str, Future] = {}
+_AUDIO_JOBS_LOCK = threading.Lock()
+_AUDIO_WORKERS: list[threading.Thread] = []
+_AUDIO_JOB_SEQ = itertools.count()
+_AUDIO_MAX_PENDING = 2000
+_AUDIO_STATS = {"tts_calls": 0, "clip_hits": 0, "pydub_fallbacks": 0, "jobs_queued": 0, "jobs_deduped": 0, "jobs_done": 0, "jobs_failed": 0}
+
+
+def _start_audio_workers() -> None:
+    """Start the worker threads once per process. Caller must hold _AUDIO_JOBS_LOCK."""
+    if _AUDIO_WORKERS:
+        return
+    try:
+        count = max(1, int(os.environ.get("WUTA_AUDIO_WORKERS") or 2))
+    except ValueError:
+        count = 2
+    for i in range(count):
+        t = threading.Thread(target=_audio_worker, name=f"wuta-audio-{i}", daemon=True)
+        t.start()
+        _AUDIO_WORKERS.append(t)
+
+
+def _enqueue_audio_job(term_id: str, term: dict, mode: str, *, urgent: bool = True) -> Future:
+    key = _audio_track(term, mode)["key"]
+    with _AUDIO_JOBS_LOCK:
+        _start_audio_workers()
+        fut = _AUDIO_JOBS.get(key)
+        if fut is None:
+            fut = Future()
+            _AUDIO_JOBS[key] = fut
+            _AUDIO_STATS["jobs_queued"] += 1
+        else:
+            _AUDIO_STATS["jobs_deduped"] += 1
+            # A queued background job gets a second, urgent queue entry; whichever entry
+            # a worker reaches first runs it and the other is skipped.
+            if not urgent or fut.running():
+                return fut
+        _AUDIO_QUEUE.put((0 if urgent else 1, next(_AUDIO_JOB_SEQ), key, (term_id, term, mode), fut))
+    return fut
+
+
+def _audio_worker() -> None:
+    while True:
+        _, _, key, (term_id, term, mode), fut = _AUDIO_QUEUE.get()
+        with _AUDIO_JOBS_LOCK:
+            if fut.running() or fut.done():
+                continue
+            fut.set_running_or_notify_cancel()
+        try:
+            path = _ensure_audio(term_id, term, mode)
+        except Exception as e:
+            print(f"Error generating {mode} audio for {term_id}: {e}")
+            _finish_audio_job(key, fut)
+            _AUDIO_STATS["jobs_failed"] += 1
+            fut.set_exception(e)
+        else:
+            _finish_audio_job(key, fut)
+            _AUDIO_STATS["jobs_done"] += 1
+            fut.set_result(path)
+
+
+def _finish_audio_job(key: str, fut: Future) -> None:
+    # Forget the job before resolving it so a later request can start a fresh attempt.
+    with _AUDIO_JOBS_LOCK:
+        if _AUDIO_JOBS.get(key) is fut:
+            del _AUDIO_JOBS[key]
+
+
+def _audio_pregenerate_setting() -> str:
+    """WUTA_AUDIO_PREGENERATE: on (default; after vocab/user-term changes), startup (also at boot), off."""
+    value = (os.environ.get("WUTA_AUDIO_PREGENERATE") or "on").strip().lower()
+    if value in {"off", "0", "false", "no", "none"}:
+        return "off"
+    return "startup" if value in {"startup", "all", "boot"} else "on"
+
+
+def _pregenerate_audio(terms: list[dict]) -> int:
+    """Queue background jobs for every missing track of terms. Returns how many were queued."""
+    if _audio_pregenerate_setting() == "off":
+        return 0
+    queued = 0
+    for term in terms:
+        term_id = term.get("id") if isinstance(term, dict) else None
+        if not term_id:
+            continue
+        for mode in _AUDIO_MODES:
+            if _audio_is_ready(term, mode):
+                continue
+            if len(_AUDIO_JOBS) >= _AUDIO_MAX_PENDING:
+                return queued
+            _enqueue_audio_job(term_id, term, mode, urgent=False)
+            queued += 1
+    return queued
+
+
+_AUDIO_DURATIONS: dict[str, float] = {}
+
+
+def _audio_duration(path: Path, key: str) -> float | None:
+    """Playback length in seconds from the track's MP3 frame headers (memoized by key)."""
+    duration = _AUDIO_DURATIONS.get(key)
+    if duration is None:
+        try:
+            frames = _mp3_frames(path.read_bytes())
+        except OSError:
+            return None
+        if not frames:
+            return None
+        duration = round(sum(info["samples"] / info["encoding"][2] for _, info in frames), 3)
+        if len(_AUDIO_DURATIONS) >= _AUDIO_TRACK_MEMO_MAX:
+            _AUDIO_DURATIONS.clear()
+        _AUDIO_DURATIONS[key] = duration
+    return duration
+
+
+def _audio_manifest_entry(term_id: str, term: dict, mode: str) -> dict:
+    """Versioned URL and readiness of one track; queues generation if it's missing."""
+    try:
+        track = _audio_track(term, mode)
+    except ValueError:
+        return {"state": "unavailable"}
+    url = url_for("get_audio", term_id=term_id, mode=None if mode == "bilingual" else mode, v=track["key"])
+    path = _audio_track_path(track["key"])
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        state = "pending"
+        if len(_AUDIO_JOBS) < _AUDIO_MAX_PENDING:
+            fut = _enqueue_audio_job(term_id, term, mode, urgent=False)
+            if fut.done() and fut.exception() is not None:
+                state = "failed"
+        return {"url": url, "state": state, "bytes": None, "duration": None}
+    return {"url": url, "state": "ready", "bytes": size, "duration": _audio_duration(path, track["key"])}
+
+
+def _belt_audio_bundle(belt_id: str, terms: list[dict], mode: str, owner_id: str | None = None) -> dict:
+    """Zip every track of terms for mode (stored, plus index.json) once all of them exist.
+
+    Returns {"key", "path"} when the bundle is ready, else {"key": None, "pending": n}
+    after queueing the missing tracks. Bundles are named by a hash of the belt's track
+    keys, so they're only rebuilt when a clip actually changes. My Words bundles are
+    per owner (owner_id), so one user's rebuild never prunes another user's bundle.
+    May raise TimeoutError while another worker is building the same bundle.
+    """
+    tracks = []
+    pending = 0
+    for term in terms:
+        term_id = term.get("id")
+        if not term_id:
+            continue
+        try:
+            track = _audio_track(term, mode)
+        except ValueError:
+            continue
+        path = _audio_track_path(track["key"])
+        if not path.exists():
+            pending += 1
+            if len(_AUDIO_JOBS) < _AUDIO_MAX_PENDING:
+                _enqueue_audio_job(term_id, term, mode, urgent=False)
+            continue
+        tracks.append((term_id, track["key"], path))
+    if pending:
+        return {"key": None, "pending": pending}
+
+    blob = json.dumps([belt_id, mode, [[term_id, key] for term_id, key, _ in tracks]])
+    key = hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+    scope = f"{belt_id}-{owner_id or 'guest'}" if belt_id == "my_words" else belt_id
+    prefix = f"{re.sub(r'[^A-Za-z0-9_-]', '_', scope)}-{mode}"
+    bundle_path = AUDIO_DIR / "bundles" / f"{prefix}-{key}.zip"
+    if bundle_path.exists():
+        return {"key": key, "path": bundle_path}
+
+    with _audio_single_flight(f"bundle-{key}", _audio_lock_timeout()):
+        if not bundle_path.exists():
+            bundle_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = bundle_path.with_name(f"{prefix}-{key}.{uuid.uuid4().hex[:8]}.tmp.zip")
+            index = {"belt_id": belt_id, "mode": mode, "key": key, "terms": []}
+            try:
+                # MP3 doesn't compress; ZIP_STORED keeps building and extracting cheap.
+                with zipfile.ZipFile(tmp_file, "w", compression=zipfile.ZIP_STORED) as zf:
+                    for term_id, track_key, path in tracks:
+                        name = f"{term_id}.mp3"
+                        zf.writestr(zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0)), path.read_bytes())
+                        index["terms"].append({
+                            "id": term_id,
+                            "file": name,
+                            "key": track_key,
+                            "url": url_for("get_audio", term_id=term_id, mode=None if mode == "bilingual" else mode, v=track_key),
+                            "bytes": path.stat().st_size,
+                            "duration": _audio_duration(path, track_key),
+                        })
+                    zf.writestr(
+                        zipfile.ZipInfo("index.json", date_time=(1980, 1, 1, 0, 0, 0)),
+                        json.dumps(index, ensure_ascii=False, indent=2),
+                    )
+                tmp_file.replace(bundle_path)
+            finally:
+                if tmp_file.exists():
+                    tmp_file.unlink()
+            for stale in bundle_path.parent.glob(f"{prefix}-*.zip"):
+                if stale != bundle_path and ".tmp." not in stale.name:
+                    try:
+                        stale.unlink()
+                    except FileNotFoundError:
+                        pass
+    return {"key": key, "path": bundle_path}
+
+
+def _pregenerate_vocab_audio(snapshot: dict) -> None:
+    """Sweep a vocabulary snapshot for missing tracks on a background thread."""
+    terms = [t for belt in snapshot["data"].get("belts", []) for t in belt.get("terms", [])]
+    threading.Thread(target=_pregenerate_audio, args=(terms,), name="wuta-audio-sweep", daemon=True).start()
+
+# Import jobs: POSTs queue the work and return a job id; a background thread processes it
+# and commits in batches. Job state lives in data/jobs/<id>.json (atomic rewrites) so
+# /jobs/<id> answers from whichever gunicorn worker the poll lands on.
+IMPORT_BATCH_SIZE = 100
+JOB_RETENTION_SECONDS = 24 * 3600
+_JOB_PUBLIC_FIELDS = ("id", "kind", "status", "total", "processed", "added", "updated", "skipped", "failed", "message", "error", "created_at", "updated_at", "finished_at")
+_IMPORT_QUEUE: queue.Queue = queue.Queue()
+_IMPORT_WORKERS: list[threading.Thread] = []
+_IMPORT_WORKERS_LOCK = threading.Lock()
+_JOB_LAST_SAVE: dict[str, float] = {}
+# Jobs queued by this process; a queued/running job owned by our pid but missing here was
+# queued by an earlier process that happened to have the same pid.
+_LOCAL_JOB_IDS: set[str] = set()
+
+
+def _job_path(job_id: str) -> Path:
+    return JOBS_DIR / f"{job_id}.json"
+
+
+def _save_job(job: dict) -> None:
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    job["updated_at"] = int(time.time())
+    path = _job_path(job["id"])
+    tmp_path = path.with_name(f"{job['id']}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp_path.write_text(json.dumps(job, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+    _JOB_LAST_SAVE[job["id"]] = time.monotonic()
+
+
+def _report_job_progress(job: dict) -> None:
+    # Counters change per row; the file is rewritten at most twice a second.
+    if time.monotonic() - _JOB_LAST_SAVE.get(job["id"], 0.0) >= 0.5:
+        _save_job(job)
+
+
+def _load_job(job_id: str) -> dict | None:
+    if not re.fullmatch(r"[0-9a-f]{32}", job_id or ""):
+        return None
+    try:
+        return json.loads(_job_path(job_id).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _job_owner() -> str:
+    """Who may read a job created in this request: the signed-in user, else this browser session."""
+    owner_id = _my_words_owner()
+    if owner_id:
+        return owner_id
+    guest_id = session.get("guest_id")
+    if not guest_id:
+        guest_id = session["guest_id"] = uuid.uuid4().hex
+    return f"guest:{guest_id}"
+
+
+def _create_job(kind: str, owner: str, **fields) -> dict:
+    now = int(time.time())
+    job = {
+        "id": uuid.uuid4().hex,
+        "kind": kind,
+        "owner": owner,
+        "pid": os.getpid(),
+        "status": "queued",
+        "total": None,
+        "processed": 0,
+        "added": 0,
+        "updated": 0,
+        "skipped": 0,
+        "failed": 0,
+        "message": "",
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+        "finished_at": None,
+    }
+    job.update(fields)
+    _LOCAL_JOB_IDS.add(job["id"])
+    # Finished jobs (and leftover uploads) are only kept for a day.
+    for path in JOBS_DIR.glob("*") if JOBS_DIR.exists() else []:
+        try:
+            if now - path.stat().st_mtime > JOB_RETENTION_SECONDS:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+    _save_job(job)
+    return job
+
+
+def _fail_job(job: dict, error: str) -> dict:
+    job["status"] = "failed"
+    job["error"] = error
+    job["finished_at"] = int(time.time())
+    _save_job(job)
+    return job
+
+
+def _job_is_orphaned(job: dict) -> bool:
+    """True for a queued/running job whose process is gone (the queue only lives in memory)."""
+    if job.get("status") not in ("queued", "running"):
+        return False
+    pid = job.get("pid")
+    if not isinstance(pid, int):
+        return True
+    if pid == os.getpid():
+        return job["id"] not in _LOCAL_JOB_IDS
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass  # alive, just not ours to signal
+    return False
+
+
+def _enqueue_import_job(job: dict, handler, payload: dict) -> None:
+    with _IMPORT_WORKERS_LOCK:
+        if not _IMPORT_WORKERS:
+            for i in range(_env_int("WUTA_IMPORT_WORKERS", 1)):
+                t = threading.Thread(target=_import_worker, name=f"wuta-import-{i}", daemon=True)
+                t.start()
+                _IMPORT_WORKERS.append(t)
+    _IMPORT_QUEUE.put((job, handler, payload))
+
+
+def _import_worker() -> None:
+    while True:
+        job, handler, payload = _IMPORT_QUEUE.get()
+        try:
+            job["status"] = "running"
+            _save_job(job)
+            handler(job, payload)
+            job["status"] = "done"
+        except Exception as e:
+            print(f"Error in {job['kind']} job {job['id']}: {e}")
+            job["status"] = "failed"
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = int(time.time())
+            try:
+                _save_job(job)
+            except OSError as e:
+                print(f"Error saving job {job['id']}: {e}")
+            _JOB_LAST_SAVE.pop(job["id"], None)
+            _LOCAL_JOB_IDS.discard(job["id"])
+            _IMPORT_QUEUE.task_done()
+
+
+def _job_response(job: dict):
+    """202 + job id for API clients (Accept: application/json)."""
+    status_url = url_for("job_status", job_id=job["id"], token=(request.form.get("token") or "").strip() or None)
+    resp = jsonify({"job_id": job["id"], "status": job["status"], "status_url": status_url})
+    resp.status_code = 202
+    resp.headers["Location"] = status_url
+    return resp
+
+
+def _wants_json() -> bool:
+    return request.accept_mimetypes.best == "application/json"
+
+
+def _run_my_words_import(job: dict, payload: dict) -> None:
+    items, category, owner_id = payload["items"], payload["category"], payload["owner_id"]
+    batch: list[dict] = []
+
+    def commit():
+        if batch:
+            _storage().add_user_terms(batch)
+            _pregenerate_audio(batch)
+            job["added"] += len(batch)
+            batch.clear()
+            _save_job(job)
+
+    for i, hangul in _translate_batch(items):
+        job["processed"] += 1
+        if hangul:
+            batch.append(_create_user_term(english=items[i], hangul=hangul, category=category, owner_id=owner_id))
+        else:
+            job["failed"] += 1
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            commit()
+        else:
+            _report_job_progress(job)
+    commit()
+
+    job["message"] = f"Imported {job['added']} word(s)." + (f" {job['failed']} couldn’t be translated." if job["failed"] else "")
+    if payload.get("truncated_at"):
+        job["message"] += f" Only the first {payload['truncated_at']} lines were imported."
+
+
+def _run_my_words_repair(job: dict, payload: dict) -> None:
+    terms = payload["terms"]
+    changes: dict[str, dict] = {}
+
+    def commit():
+        if changes:
+            _storage().update_user_terms(changes)
+            job["updated"] += len(changes)
+            changes.clear()
+            _save_job(job)
+
+    for i, hangul in _translate_batch([t["english"] for t in terms]):
+        job["processed"] += 1
+        if hangul:
+            changes[terms[i]["id"]] = {"hangul": hangul}
+        else:
+            job["failed"] += 1
+        if len(changes) >= IMPORT_BATCH_SIZE:
+            commit()
+        else:
+            _report_job_progress(job)
+    commit()
+
+    job["message"] = f"Repaired {job['updated']} word(s)." + (f" {job['failed']} could not be translated." if job["failed"] else "")
+
+
+_DICTIONARY_CSV_COLUMNS = ("english", "hangul", "romanization", "category")
+
+
+def _iter_dictionary_csv(stream):
+    """Yield {english, hangul, romanization, category} rows from a binary CSV stream.
+
+    Decodes incrementally (UTF-8, BOM-aware) so memory stays bounded by one row. The
+    first non-blank row is a header if it names an english or hangul column; otherwise
+    it is data in english,hangul,romanization?,category? order.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        columns = None
+        for r in csv.reader(text):
+            if not r or all(not (c or "").strip() for c in r):
+                continue
+            if columns is None:
+                names = [(c or "").strip().lower() for c in r]
+                if "english" in names or "hangul" in names:
+                    columns = {name: names.index(name) for name in _DICTIONARY_CSV_COLUMNS if name in names}
+                    continue
+                columns = {name: i for i, name in enumerate(_DICTIONARY_CSV_COLUMNS)}
+            yield {name: (r[i] if i < len(r) else "") for name, i in columns.items()}
+    finally:
+        text.detach()
+
+
+def _run_dictionary_import(job: dict, payload: dict) -> None:
+    upload_path = Path(payload["upload_path"])
+    now = int(time.time())
+    store = _storage()
+    # SQLite commits a small transaction per batch. A JSON write rewrites the whole file
+    # (already held in memory by the index), so there every row goes into one upsert at
+    # the end; the job file still reports progress as rows are read.
+    batch_size = IMPORT_BATCH_SIZE if store.name == "sqlite" else None
+    batch: list[dict] = []
+
+    def commit():
+        if batch:
+            added, updated = store.upsert_dictionary_entries(batch, now)
+            # New entries are used for lookups as soon as they're committed.
+            _hangul_index().upsert(batch)
+            job["added"] += added
+            job["updated"] += updated
+            batch.clear()
+            _save_job(job)
+
+    try:
+        with open(upload_path, "rb") as fh:
+            for r in _iter_dictionary_csv(fh):
+                job["processed"] += 1
+                eng = (r.get("english") or "").strip()
+                han = _clean_korean_candidate(r.get("hangul") or "")
+                if not eng or not _has_hangul(han):
+                    job["skipped"] += 1
+                    _report_job_progress(job)
+                    continue
+                batch.append({
+                    "english": eng,
+                    "hangul": han,
+                    "romanization": (r.get("romanization") or "").strip(),
+                    "category": (r.get("category") or "").strip(),
+                })
+                if batch_size and len(batch) >= batch_size:
+                    commit()
+                else:
+                    _report_job_progress(job)
+            commit()
+    finally:
+        upload_path.unlink(missing_ok=True)
 
+    job["total"] = job["processed"]
+    job["message"] = f"Imported: {job['added']} added, {job['updated']} updated, {job['skipped']} skipped."
 
-def _create_user_term(*, english: str, hangul: str, romanization: str | None = None, category: str | None = None) -> dict:
-    now = int(time.time())
-    return {
-        "id": f"u_{uuid.uuid4().hex}",
-        "english": (english or "").strip(),
-        "hangul": (hangul or "").strip(),
-        "romanization": (romanization or "").strip(),
-        "category": (category or "User") .strip() or "User",
-        "created_at": now,
-        "source": "user",
-    }
 
+# Per-process vocabulary snapshot. Swapped atomically when DATA_PATH changes on disk;
+# request handlers share it across threads and must treat it as read-only.
+_VOCAB_LOCK = threading.Lock()
+_VOCAB_SNAPSHOT: dict | None = None
+_VOCAB_STATS = {"checks": 0, "loads": 0, "unchanged_reloads": 0, "load_errors": 0, "versions": {}}
+_VOCAB_STATS_MAX_VERSIONS = 8
 
-def _load_audio_meta(meta_path: Path):
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return a cheap (mtime_ns, size) change stamp for path, or None if it doesn't exist."""
     try:
-        if not meta_path.exists():
-            return None
-        return json.loads(meta_path.read_text(encoding="utf-8"))
-    except Exception:
+        st = path.stat()
+    except OSError:
         return None
+    return (st.st_mtime_ns, st.st_size)
 
 
-def _write_audio_meta(meta_path: Path, payload: dict):
-    meta_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
+def _build_vocab_snapshot(data: dict, version: str, stamp, generation: int) -> dict:
+    api_terms = _build_api_terms(data)
+    return {
+        "version": version,
+        "generation": generation,
+        "stamp": stamp,
+        "loaded_at": int(time.time()),
+        "data": data,
+        "terms_by_id": _build_term_index(data),
+        "api_terms": api_terms,
+        "term_digests": _term_digests(api_terms),
+        "home_belts": combine_belts_with_tips(data.get("belts", [])),
+        "belt_views": _build_belt_views(data),
+    }
 
-def _should_upgrade_audio(audio_path: Path, meta: dict | None):
-    """Return True if we should attempt to regenerate bilingual audio.
 
-    We use a sidecar meta file to avoid repeatedly regenerating.
-    For legacy files without meta, we use a conservative size heuristic.
-    """
-    if not audio_path.exists():
-        return True
+def _build_belt_views(data: dict) -> dict[str, dict]:
+    """Precompute what /belts/<belt_id> renders: normalized belt dict, header tone and term count."""
+    views: dict[str, dict] = {}
+    for belt in data.get("belts", []):
+        belt_id = belt.get("belt_id")
+        if not belt_id or belt_id in views:
+            continue
+        belt_color = _get_belt_color(belt)
+        views[belt_id] = {
+            # Normalize belt_color so templates/CSS can rely on it.
+            "belt": {**belt, "belt_color": belt_color},
+            "belt_tone": "dark" if _is_dark_hex_color(belt_color) else "light",
+            "total_terms": len(belt.get("terms", [])),
+        }
+    return views
 
-    # Schema v3: bilingual audio includes an English intro phrase and speaks English first.
-    if meta and meta.get("schema_version") == 3 and meta.get("mode") == "bilingual":
-        return False
 
-    # Legacy cache: without meta, we can't trust what was generated.
-    # Regenerate once so we can write the current schema meta and avoid future mismatches.
-    if not meta:
-        return True
+def _build_api_terms(data: dict) -> dict[str, dict]:
+    """term id -> term plus its belt_id, in file order (first occurrence of an id wins)."""
+    terms: dict[str, dict] = {}
+    for belt in data.get("belts", []):
+        for term in belt.get("terms", []):
+            term_id = term.get("id")
+            if term_id and term_id not in terms:
+                terms[term_id] = {**term, "belt_id": belt.get("belt_id")}
+    return terms
 
-    # Known non-bilingual or unknown schema => try upgrading.
-    return True
 
+def _term_digests(api_terms: dict[str, dict]) -> dict[str, str]:
+    return {
+        term_id: hashlib.sha1(json.dumps(term, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        for term_id, term in api_terms.items()
+    }
 
-def _generate_bilingual_mp3(term: dict, out_path: Path):
-    """Generate bilingual MP3 (English intro + Korean) to out_path."""
-    from pydub import AudioSegment
-    import io
 
-    english = (term.get("english") or "").strip()
-    hangul = _clean_korean_candidate(term.get("hangul") or "")
-    romanization = (term.get("romanization") or "").strip()
+# One small file per vocabulary version (term id -> content digest) so /api/v1/vocab can
+# answer ?since=<old version> with a diff, across restarts and in every worker.
+VOCAB_HISTORY_MAX = 50
 
-    # English first: include a short prompt for clarity.
-    # Example: "The word is Front Kick."
-    english_prompt = f"The word is {english}." if english else ""
-    english_tts = gTTS(text=english_prompt or english or hangul, lang="en", slow=False)
-    english_audio_bytes = io.BytesIO()
-    english_tts.write_to_fp(english_audio_bytes)
-    english_audio_bytes.seek(0)
 
-    # Korean stays slow for learning.
-    # IMPORTANT: never feed English into a Korean voice (sounds like a "Korean accent").
-    korean_text = hangul if _has_hangul(hangul) else ""
-    if not korean_text and english:
-        korean_text = _best_effort_hangul_for_english(english)
-
-    korean_audio = None
-    if korean_text:
-        korean_tts = gTTS(text=korean_text, lang="ko", slow=True)
-        korean_audio_bytes = io.BytesIO()
-        korean_tts.write_to_fp(korean_audio_bytes)
-        korean_audio_bytes.seek(0)
-        korean_audio = AudioSegment.from_mp3(korean_audio_bytes)
-    elif romanization:
-        # Last-resort fallback: speak romanization with an English voice so it doesn't sound like a bad "translation".
-        rom_tts = gTTS(text=romanization, lang="en", slow=False)
-        rom_audio_bytes = io.BytesIO()
-        rom_tts.write_to_fp(rom_audio_bytes)
-        rom_audio_bytes.seek(0)
-        korean_audio = AudioSegment.from_mp3(rom_audio_bytes)
-
-    english_audio = AudioSegment.from_mp3(english_audio_bytes)
-    if korean_audio is not None:
-        pause = AudioSegment.silent(duration=650)
-        combined = english_audio + pause + korean_audio
-    else:
-        combined = english_audio
+def _write_vocab_history(snapshot: dict) -> None:
+    path = VOCAB_HISTORY_DIR / f"{snapshot['version']}.json"
+    if path.exists():
+        return
+    VOCAB_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.stem}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp_path.write_text(json.dumps({"version": snapshot["version"], "terms": snapshot["term_digests"]}), encoding="utf-8")
+    tmp_path.replace(path)
+    old = sorted(VOCAB_HISTORY_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    for stale in old[:-VOCAB_HISTORY_MAX]:
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    combined.export(str(out_path), format="mp3")
 
+def _ensure_vocab_history(snapshot: dict) -> None:
+    """Record snapshot's digests once per process, the first time its version is handed to an API client."""
+    if snapshot.get("history_written"):
+        return
+    try:
+        _write_vocab_history(snapshot)
+    except OSError as e:
+        print(f"Error recording vocabulary history for {snapshot['version']}: {e}")
+    snapshot["history_written"] = True
 
-def _generate_korean_only_mp3(term: dict, out_path: Path):
-    hangul = _clean_korean_candidate(term.get("hangul") or "")
-    if not _has_hangul(hangul):
-        # Try translating from English before giving up.
-        hangul = _best_effort_hangul_for_english((term.get("english") or "").strip())
-    if not _has_hangul(hangul):
-        raise ValueError("No valid Hangul available for Korean-only audio")
 
-    tts = gTTS(text=hangul, lang="ko", slow=True)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    tts.save(str(out_path))
+# Digests of earlier versions by version; only hits are kept, since a version another
+# worker hasn't recorded yet may show up on disk a moment later.
+_VOCAB_HISTORY_CACHE: dict[str, dict[str, str]] = {}
+_VOCAB_HISTORY_CACHE_MAX = 16
 
 
-def _generate_english_only_mp3(term: dict, out_path: Path):
-    english = (term.get("english") or "").strip()
-    hangul = (term.get("hangul") or "").strip()
+def _load_vocab_history(version: str) -> dict[str, str] | None:
+    """Term digests recorded for an earlier version, or None if unknown/pruned."""
+    if not re.fullmatch(r"[0-9a-f]{12}", version or ""):
+        return None
+    digests = _VOCAB_HISTORY_CACHE.get(version)
+    if digests is not None:
+        return digests
+    try:
+        digests = json.loads((VOCAB_HISTORY_DIR / f"{version}.json").read_text(encoding="utf-8"))["terms"]
+    except (OSError, ValueError, KeyError):
+        return None
+    if len(_VOCAB_HISTORY_CACHE) >= _VOCAB_HISTORY_CACHE_MAX:
+        _VOCAB_HISTORY_CACHE.pop(next(iter(_VOCAB_HISTORY_CACHE)))
+    _VOCAB_HISTORY_CACHE[version] = digests
+    return digests
+
+
+def _record_vocab_version(snapshot: dict) -> None:
+    versions = _VOCAB_STATS["versions"]
+    versions[snapshot["version"]] = {
+        "generation": snapshot["generation"],
+        "loaded_at": snapshot["loaded_at"],
+        "hits": 0,
+    }
+    # Keep the counters bounded; only the most recent versions are interesting.
+    while len(versions) > _VOCAB_STATS_MAX_VERSIONS:
+        versions.pop(next(iter(versions)))
 
-    # Keep the same learning-friendly prompt as bilingual mode.
-    english_prompt = f"The word is {english}." if english else ""
-    tts = gTTS(text=english_prompt or english or hangul, lang="en", slow=False)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    tts.save(str(out_path))
 
-def load_data():
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _get_vocab_snapshot() -> dict:
+    """Return the current vocabulary snapshot, re-reading DATA_PATH only when its mtime/size changes.
 
-def get_belt(data, belt_id):
-    return next((b for b in data["belts"] if b["belt_id"] == belt_id), None)
+    The version is a content hash, so every gunicorn worker agrees on it for the same file.
+    If a reload fails (e.g. a half-written terms.json) we keep serving the previous snapshot.
+    """
+    global _VOCAB_SNAPSHOT
+    stamp = _file_stamp(DATA_PATH)
+    snap = _VOCAB_SNAPSHOT
+    if snap is None or snap["stamp"] != stamp:
+        previous = None
+        with _VOCAB_LOCK:
+            snap = _VOCAB_SNAPSHOT
+            if snap is None or snap["stamp"] != stamp:
+                previous = snap
+                snap = _reload_vocab_snapshot(snap, stamp)
+                _VOCAB_SNAPSHOT = snap
+        if snap is not previous and (previous is None or previous["version"] != snap["version"]):
+            # New vocabulary: queue audio for new/edited terms (at boot only if configured).
+            if previous is not None or _audio_pregenerate_setting() == "startup":
+                _pregenerate_vocab_audio(snap)
+
+    # Counters are best-effort (not locked); they only feed /admin/stats.
+    _VOCAB_STATS["checks"] += 1
+    entry = _VOCAB_STATS["versions"].get(snap["version"])
+    if entry is not None:
+        entry["hits"] += 1
+    return snap
+
+
+def _reload_vocab_snapshot(previous: dict | None, stamp) -> dict:
+    """Load DATA_PATH into a new snapshot. Caller must hold _VOCAB_LOCK."""
+    try:
+        raw = DATA_PATH.read_bytes()
+        version = hashlib.sha1(raw).hexdigest()[:12]
+        if previous is not None and previous["version"] == version:
+            # Touched but unchanged: keep the parsed data, just remember the new stamp.
+            _VOCAB_STATS["unchanged_reloads"] += 1
+            return {**previous, "stamp": stamp}
+        data = json.loads(raw.decode("utf-8"))
+        generation = (previous["generation"] + 1) if previous is not None else 1
+        snap = _build_vocab_snapshot(data, version, stamp, generation)
+    except Exception as e:
+        _VOCAB_STATS["load_errors"] += 1
+        if previous is None:
+            raise
+        print(f"Error reloading vocabulary from {DATA_PATH}: {e}")
+        # Don't retry on every request; the next write to terms.json changes the stamp again.
+        return {**previous, "stamp": stamp}
+
+    _VOCAB_STATS["loads"] += 1
+    _record_vocab_version(snap)
+    return snap
+
+
+def _vocab_stats() -> dict:
+    snap = _VOCAB_SNAPSHOT
+    return {
+        "version": snap["version"] if snap else None,
+        "generation": snap["generation"] if snap else 0,
+        "checks": _VOCAB_STATS["checks"],
+        "loads": _VOCAB_STATS["loads"],
+        "reloads": max(0, _VOCAB_STATS["loads"] - 1),
+        "unchanged_reloads": _VOCAB_STATS["unchanged_reloads"],
+        "load_errors": _VOCAB_STATS["load_errors"],
+        "versions": {k: dict(v) for k, v in list(_VOCAB_STATS["versions"].items())},
+    }
 
 def combine_belts_with_tips(belts):
     """Combine main belt colors with their tips into single entries"""
     combined = []
     main_colors = ['white', 'yellow', 'orange', 'green', 'blue', 'purple', 'brown', 'red', 'black']
+    by_id = {}
+    for b in belts:
+        by_id.setdefault(b["belt_id"], b)
     
     for color in main_colors:
         # Find main belt
-        main_belt = next((b for b in belts if b["belt_id"] == color), None)
+        main_belt = by_id.get(color)
         if not main_belt:
             continue
             
         # Find tip belt
-        tip_belt = next((b for b in belts if b["belt_id"] == f"{color}_tip"), None)
+        tip_belt = by_id.get(f"{color}_tip")
         
         # Combine terms
         combined_terms = main_belt["terms"].copy()
@@ -728,16 +2895,16 @@ def register():
             next=next_url,
         )
 
-    payload = _load_users_data()
-    users = payload.get("users", [])
-    if not isinstance(users, list):
-        users = []
-
     new_user = _create_user(username=username, email=email, password=password)
-    users.append(new_user)
-    payload["schema_version"] = 1
-    payload["users"] = users
-    _save_users_data(payload)
+    conflict = _storage().add_user(new_user)
+    if conflict:
+        return render_template(
+            "register.html",
+            error="That username is already taken." if conflict == "username" else "An account with that email already exists.",
+            pref_username=username_raw,
+            pref_email=email_raw,
+            next=next_url,
+        )
 
     session["user_id"] = new_user["id"]
     return redirect(next_url or url_for("home"))
@@ -815,16 +2982,7 @@ def account_delete():
     if not check_password_hash((user.get("password_hash") or ""), password):
         return render_template("account.html", user=user, error="Incorrect password.")
 
-    payload = _load_users_data()
-    users = payload.get("users", [])
-    if not isinstance(users, list):
-        users = []
-
-    uid = user.get("id")
-    users = [u for u in users if not (isinstance(u, dict) and u.get("id") == uid)]
-    payload["schema_version"] = 1
-    payload["users"] = users
-    _save_users_data(payload)
+    _storage().delete_user(user.get("id"))
 
     try:
         session.pop("user_id", None)
@@ -836,35 +2994,318 @@ def account_delete():
 
 @app.route("/")
 def home():
-    data = load_data()
-    combined_belts = combine_belts_with_tips(data["belts"])
-    return render_template("home.html", belts=combined_belts, my_words_count=len(_list_user_terms()))
+    combined_belts = _get_vocab_snapshot()["home_belts"]
+    return render_template("home.html", belts=combined_belts, my_words_count=_storage().count_user_terms(_my_words_owner()))
+
+# Fully rendered belt pages, one per (belt_id, vocabulary version). They are rendered
+# as the guest sees them; for a signed-in user only the header's account actions
+# (templates/_account_actions.html) are swapped in, so every student shares one entry.
+_BELT_PAGE_CACHE: collections.OrderedDict = collections.OrderedDict()
+_BELT_PAGE_CACHE_LOCK = threading.Lock()
+_BELT_PAGE_CACHE_MAX = 40  # all belts for the current and previous vocabulary version
+_BELT_PAGE_STATS = {"hits": 0, "misses": 0}
+_APP_STARTED_AT = int(time.time())
+
+
+def _belt_page_body(view: dict, user: dict | None) -> bytes:
+    return render_template(
+        "terms.html",
+        belt=view["belt"],
+        total_terms=view["total_terms"],
+        belt_tone=view["belt_tone"],
+        terms_url=url_for("belt_terms_json", belt_id=view["belt"]["belt_id"], v=_belt_terms_json(view)["etag"]),
+        current_user=user,
+    ).encode("utf-8")
+
+
+def _render_belt_page(view: dict, snapshot: dict, user: dict | None) -> dict:
+    key = (view["belt"]["belt_id"], snapshot["version"])
+    with _BELT_PAGE_CACHE_LOCK:
+        entry = _BELT_PAGE_CACHE.get(key)
+        if entry is not None:
+            _BELT_PAGE_CACHE.move_to_end(key)
+            _BELT_PAGE_STATS["hits"] += 1
+
+    if entry is None:
+        body = _belt_page_body(view, None)
+        guest_actions = render_template("_account_actions.html", current_user=None).encode("utf-8")
+        start = body.find(guest_actions)
+        entry = {
+            "body": body,
+            "etag": hashlib.sha1(body).hexdigest(),
+            "actions": (start, start + len(guest_actions)) if start >= 0 else None,
+        }
+        with _BELT_PAGE_CACHE_LOCK:
+            _BELT_PAGE_STATS["misses"] += 1
+            _BELT_PAGE_CACHE[key] = entry
+            # Entries for old vocabulary versions simply age out.
+            while len(_BELT_PAGE_CACHE) > _BELT_PAGE_CACHE_MAX:
+                _BELT_PAGE_CACHE.popitem(last=False)
+
+    if not user:
+        return entry
+    if entry["actions"] is None:
+        body = _belt_page_body(view, user)
+        return {"body": body, "etag": hashlib.sha1(body).hexdigest()}
+    actions = render_template("_account_actions.html", current_user=user).encode("utf-8")
+    start, end = entry["actions"]
+    return {
+        "body": entry["body"][:start] + actions + entry["body"][end:],
+        "etag": hashlib.sha1(entry["etag"].encode("ascii") + actions).hexdigest(),
+    }
+
+
+# Compact term rows for /api/belts/<belt_id>/terms.json: field names are sent once ("k"),
+# categories are factored into a list ("c") and referenced by index, and trailing empty
+# fields are dropped. "audio" holds the track keys for the modes in "m" (null for a mode
+# with nothing to speak, e.g. Korean-only without Hangul).
+_COMPACT_TERM_FIELDS = ("id", "hangul", "romanization", "english", "category", "image_path", "legacy_id", "audio")
+
+
+def _terms_json_entry(terms: list[dict]) -> dict:
+    """Encoded compact payload for terms: {"body", "etag"}."""
+    audio_versions = _audio_versions(terms)
+    categories: list[str] = []
+    category_index: dict[str, int] = {}
+    rows = []
+    for term in terms:
+        row = []
+        for field in _COMPACT_TERM_FIELDS:
+            if field == "audio":
+                versions = audio_versions.get(term.get("id"))
+                value = [versions.get(mode) for mode in _AUDIO_MODES] if versions else None
+            else:
+                value = term.get(field) or None
+            if field == "category" and value is not None:
+                if value not in category_index:
+                    category_index[value] = len(categories)
+                    categories.append(value)
+                value = category_index[value]
+            row.append(value)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    payload = {"k": list(_COMPACT_TERM_FIELDS), "c": categories, "m": list(_AUDIO_MODES), "t": rows}
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return {"body": body, "etag": hashlib.sha1(body).hexdigest()[:16]}
+
+
+def _belt_terms_json(view: dict) -> dict:
+    # Belt views belong to one vocabulary snapshot, so the payload is built once per version.
+    entry = view.get("terms_json")
+    if entry is None:
+        entry = view["terms_json"] = _terms_json_entry(view["belt"].get("terms", []))
+    return entry
+
+
+@app.route("/api/belts/<belt_id>/terms.json")
+def belt_terms_json(belt_id):
+    """A belt's terms in the compact encoding above.
+
+    With ?v=<etag> (the URL the belt page embeds) the response is immutable; without it,
+    clients revalidate with If-None-Match. "my_words" serves the signed-in user's deck.
+    """
+    if belt_id == "my_words":
+        entry = _terms_json_entry(_list_user_terms(_my_words_owner()))
+    else:
+        view = _get_vocab_snapshot()["belt_views"].get(belt_id)
+        if not view:
+            abort(404)
+        entry = _belt_terms_json(view)
+
+    resp = app.response_class(entry["body"], mimetype="application/json")
+    resp.set_etag(entry["etag"])
+    if request.args.get("v") == entry["etag"]:
+        resp.cache_control.max_age = STATIC_IMMUTABLE_MAX_AGE
+        resp.cache_control.immutable = True
+    else:
+        resp.cache_control.no_cache = True
+    if belt_id == "my_words":
+        resp.cache_control.private = True
+        resp.vary.add("Cookie")
+    else:
+        resp.cache_control.public = True
+    return resp.make_conditional(request)
+
+
+VOCAB_API_FIELDS = ("id", "belt_id", "hangul", "romanization", "english", "category", "image_path", "legacy_id")
+
+
+@app.route("/api/v1/vocab")
+def api_vocab():
+    """Vocabulary as JSON for app clients.
+
+    ?fields=id,hangul,romanization projects each term (id is always included).
+    ?since=<version> returns only terms added/changed since that version plus removed ids;
+    if that version is unknown (or too old), the full list comes back with "full": true.
+    """
+    snapshot = _get_vocab_snapshot()
+    version = snapshot["version"]
+
+    fields = list(VOCAB_API_FIELDS)
+    if request.args.get("fields"):
+        requested = [f.strip() for f in request.args["fields"].split(",") if f.strip()]
+        unknown = [f for f in requested if f not in VOCAB_API_FIELDS]
+        if unknown:
+            resp = jsonify({"error": "unknown fields", "fields": unknown, "allowed": list(VOCAB_API_FIELDS)})
+            resp.status_code = 400
+            return resp
+        fields = ["id"] + [f for f in VOCAB_API_FIELDS if f in requested and f != "id"]
+
+    def project(term: dict) -> dict:
+        return {f: term[f] for f in fields if term.get(f) not in (None, "")}
+
+    api_terms = snapshot["api_terms"]
+    # Clients send this version back as ?since=, so its digests must be on disk by then.
+    _ensure_vocab_history(snapshot)
+    since = (request.args.get("since") or "").strip()
+    previous = _load_vocab_history(since) if since and since != version else None
+    if since == version:
+        payload = {"version": version, "since": since, "full": False, "upserted": [], "removed": []}
+    elif previous is not None:
+        current = snapshot["term_digests"]
+        payload = {
+            "version": version,
+            "since": since,
+            "full": False,
+            "upserted": [project(api_terms[t]) for t, digest in current.items() if previous.get(t) != digest],
+            "removed": [t for t in previous if t not in current],
+        }
+    else:
+        payload = {
+            "version": version,
+            "full": True,
+            "fields": fields,
+            "belts": [
+                {"belt_id": view["belt"]["belt_id"], "belt_name": view["belt"].get("belt_name"), "belt_color": view["belt"]["belt_color"]}
+                for view in snapshot["belt_views"].values()
+            ],
+            "terms": [project(term) for term in api_terms.values()],
+        }
+
+    resp = jsonify(payload)
+    resp.set_etag(hashlib.sha1(f"{version}|{since}|{','.join(fields)}".encode("utf-8")).hexdigest()[:16])
+    resp.cache_control.public = True
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
+
 
 @app.route("/belts/<belt_id>")
 def belt_terms(belt_id):
-    data = load_data()
-    belt = get_belt(data, belt_id)
-    if not belt:
+    snapshot = _get_vocab_snapshot()
+    view = snapshot["belt_views"].get(belt_id)
+    if not view:
         abort(404)
-    belt_color = _get_belt_color(belt)
-    # Normalize belt_color so templates/CSS can rely on it.
+
+    user = _get_current_user()
+    entry = _render_belt_page(view, snapshot, user)
+
+    resp = app.response_class(entry["body"], mimetype="text/html")
+    resp.set_etag(entry["etag"])
+    # Templates only change on deploy (process restart), so that bounds Last-Modified too.
+    mtime = max((snapshot["stamp"] or (0, 0))[0] // 1_000_000_000, _APP_STARTED_AT)
+    resp.last_modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
+    # Always revalidate (cheap 304s); signed-in pages must never land in shared caches.
+    resp.cache_control.no_cache = True
+    if user:
+        resp.cache_control.private = True
+    resp.vary.add("Cookie")
+    return resp.make_conditional(request)
+
+
+def _belt_audio_terms(belt_id: str) -> tuple[list[dict], str | None]:
+    """Terms behind a belt's audio endpoints and the vocabulary version (None for My Words)."""
+    if belt_id == "my_words":
+        return _list_user_terms(_my_words_owner()), None
+    snapshot = _get_vocab_snapshot()
+    view = snapshot["belt_views"].get(belt_id)
+    if not view:
+        abort(404)
+    return view["belt"].get("terms", []), snapshot["version"]
+
+
+@app.route("/belts/<belt_id>/audio-manifest")
+def belt_audio_manifest(belt_id):
+    """Per-term, per-mode audio URLs, sizes, durations and readiness for a whole belt.
+
+    Missing tracks are queued for generation, so one call warms the belt. ?mode= limits
+    the manifest to one pronunciation mode. "my_words" covers the My Words training deck.
+    """
+    terms, version = _belt_audio_terms(belt_id)
+    modes = [_normalize_audio_mode(request.args["mode"])] if request.args.get("mode") else list(_AUDIO_MODES)
+    entries = []
+    pending = 0
+    for term in terms:
+        if not term.get("id"):
+            continue
+        audio = {mode: _audio_manifest_entry(term["id"], term, mode) for mode in modes}
+        pending += sum(1 for entry in audio.values() if entry["state"] == "pending")
+        entries.append({"id": term["id"], "audio": audio})
+
+    resp = jsonify({"belt_id": belt_id, "version": version, "modes": modes, "pending": pending, "terms": entries})
+    resp.cache_control.no_cache = True
+    if pending:
+        resp.headers["Retry-After"] = "2"
+    return resp
+
+
+@app.route("/belts/<belt_id>/audio-bundle")
+def belt_audio_bundle(belt_id):
+    """All of a belt's clips for one mode as a single zip (<term_id>.mp3 + index.json).
+
+    Returns 202 with Retry-After while missing clips are generated. Pass ?v=<key> from
+    the X-Bundle-Key header (or index.json) for an immutable, long-cached response.
+    """
+    terms, _ = _belt_audio_terms(belt_id)
+    mode = _normalize_audio_mode(request.args.get("mode"))
+    owner_id = _my_words_owner() if belt_id == "my_words" else None
     try:
-        belt["belt_color"] = belt_color
-    except Exception:
-        pass
-    belt_tone = "dark" if _is_dark_hex_color(belt_color) else "light"
+        bundle = _belt_audio_bundle(belt_id, terms, mode, owner_id)
+    except TimeoutError:
+        # Another worker is still zipping this bundle.
+        bundle = {"key": None, "pending": 0}
+    if bundle["key"] is None:
+        resp = jsonify({"status": "pending", "belt_id": belt_id, "mode": mode, "pending": bundle["pending"]})
+        resp.status_code = 202
+        resp.headers["Retry-After"] = "5"
+        return resp
+
+    resp = _send_audio(
+        bundle["path"],
+        bundle["key"],
+        request.args.get("v") or None,
+        mimetype="application/zip",
+        download_name=f"{belt_id}-{mode}-audio.zip",
+    )
+    resp.headers["X-Bundle-Key"] = bundle["key"]
+    return resp
+
+
+MY_WORDS_PAGE_SIZE = 50
+
+
+def _render_my_words(page: int = 1, **context):
+    """Render My Words for the current owner, showing one page of saved terms (newest first)."""
+    owner_id = _my_words_owner()
+    store = _storage()
+    total = store.count_user_terms(owner_id)
+    page_count = max(1, -(-total // MY_WORDS_PAGE_SIZE))
+    page = min(max(1, page), page_count)
+    terms = store.page_user_terms(owner_id, MY_WORDS_PAGE_SIZE, (page - 1) * MY_WORDS_PAGE_SIZE)
     return render_template(
-        "terms.html",
-        belt=belt,
-        total_terms=len(belt.get("terms", [])),
-        belt_tone=belt_tone,
+        "my_words.html",
+        terms=terms,
+        total_terms=total,
+        page=page,
+        page_count=page_count,
+        import_max_lines=_env_int("WUTA_IMPORT_MAX_LINES", 500),
+        **context,
     )
 
 
 @app.route("/my-words")
 def my_words():
-    terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-    return render_template("my_words.html", terms=terms)
+    return _render_my_words(page=request.args.get("page", 1, type=int))
 
 
 @app.route("/my-words/add", methods=["POST"])
@@ -875,8 +3316,7 @@ def my_words_add():
     category = (request.form.get("category") or "User").strip()
 
     if not english:
-        terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-        return render_template("my_words.html", terms=terms, error="Please enter an English word or phrase.")
+        return _render_my_words(error="Please enter an English word or phrase.")
 
     hangul = _clean_korean_candidate(hangul)
     if not hangul:
@@ -887,10 +3327,7 @@ def my_words_add():
         hangul = ""
 
     if not hangul:
-        terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-        return render_template(
-            "my_words.html",
-            terms=terms,
+        return _render_my_words(
             error=(
                 "I couldn't auto-translate that right now (or the Hangul field didn’t look like Korean). "
                 "Please paste the Korean (Hangul) translation (e.g., '앞차기'), "
@@ -901,19 +3338,11 @@ def my_words_add():
             pref_romanization=romanization,
         )
 
-    payload = _load_user_terms_data()
-    terms_list = payload.get("terms", [])
-    if not isinstance(terms_list, list):
-        terms_list = []
-
-    new_term = _create_user_term(english=english, hangul=hangul, romanization=romanization, category=category)
-    terms_list.append(new_term)
-    payload["terms"] = terms_list
-    payload["schema_version"] = 1
-    _save_user_terms_data(payload)
+    new_term = _create_user_term(english=english, hangul=hangul, romanization=romanization, category=category, owner_id=_my_words_owner())
+    _storage().add_user_terms([new_term])
+    _pregenerate_audio([new_term])
 
-    terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-    return render_template("my_words.html", terms=terms, notice="Added!")
+    return _render_my_words(notice="Added!")
 
 
 @app.route("/my-words/import", methods=["POST"])
@@ -929,49 +3358,32 @@ def my_words_import():
         items.append(s)
 
     if not items:
-        terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-        return render_template("my_words.html", terms=terms, error="Paste one English word/phrase per line to import.")
-
-    # Safety limits so we don't hammer translation/audio services.
-    if len(items) > 50:
-        items = items[:50]
-
-    payload = _load_user_terms_data()
-    terms_list = payload.get("terms", [])
-    if not isinstance(terms_list, list):
-        terms_list = []
-
-    added = 0
-    failed = 0
-    for english in items:
-        hangul = _best_effort_hangul_for_english(english)
-        if not hangul:
-            failed += 1
-            continue
-        terms_list.append(_create_user_term(english=english, hangul=hangul, category=category))
-        added += 1
-
-    payload["terms"] = terms_list
-    payload["schema_version"] = 1
-    _save_user_terms_data(payload)
-
-    terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-    notice = f"Imported {added} word(s)." + (f" {failed} couldn’t be translated." if failed else "")
-    return render_template("my_words.html", terms=terms, notice=notice)
+        return _render_my_words(error="Paste one English word/phrase per line to import.")
+
+    # Safety limit; translation itself is deduped, pooled and rate-limited.
+    max_lines = _env_int("WUTA_IMPORT_MAX_LINES", 500)
+    truncated = len(items) > max_lines
+    items = items[:max_lines]
+
+    owner_id = _my_words_owner()
+    job = _create_job("my_words_import", _job_owner(), total=len(items))
+    _enqueue_import_job(
+        job,
+        _run_my_words_import,
+        {"items": items, "category": category, "owner_id": owner_id, "truncated_at": max_lines if truncated else None},
+    )
+    if _wants_json():
+        return _job_response(job)
+    return _render_my_words(notice=f"Importing {len(items)} word(s)…", job=job)
 
 
 @app.route("/my-words/repair", methods=["POST"])
 def my_words_repair():
     """Repair saved user terms whose Hangul is missing/invalid by attempting auto-translation."""
-    payload = _load_user_terms_data()
-    terms_list = payload.get("terms", [])
-    if not isinstance(terms_list, list):
-        terms_list = []
-
-    fixed = 0
+    to_repair = []
     failed = 0
-    for t in terms_list:
-        if not isinstance(t, dict):
+    for t in _list_user_terms(_my_words_owner()):
+        if not isinstance(t, dict) or not t.get("id"):
             continue
         english = (t.get("english") or "").strip()
         hangul = _clean_korean_candidate(t.get("hangul") or "")
@@ -982,22 +3394,18 @@ def my_words_repair():
         if not english:
             failed += 1
             continue
+        to_repair.append({"id": t["id"], "english": english})
 
-        new_hangul = _best_effort_hangul_for_english(english)
-        if not new_hangul:
-            failed += 1
-            continue
-
-        t["hangul"] = new_hangul
-        fixed += 1
+    if not to_repair:
+        notice = "Nothing to repair." + (f" {failed} word(s) have no English to translate." if failed else "")
+        return _render_my_words(notice=notice)
 
-    payload["terms"] = terms_list
-    payload["schema_version"] = 1
-    _save_user_terms_data(payload)
-
-    terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-    notice = f"Repaired {fixed} word(s)." + (f" {failed} could not be translated." if failed else "")
-    return render_template("my_words.html", terms=terms, notice=notice)
+    # Translation waits on the provider and the rate limiter, so it runs as a job.
+    job = _create_job("my_words_repair", _job_owner(), total=len(to_repair) + failed, processed=failed, failed=failed)
+    _enqueue_import_job(job, _run_my_words_repair, {"terms": to_repair})
+    if _wants_json():
+        return _job_response(job)
+    return _render_my_words(notice=f"Repairing {len(to_repair)} word(s)…", job=job)
 
 
 @app.route("/admin/dictionary")
@@ -1042,51 +3450,9 @@ def admin_dictionary_save():
         entries = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
         return render_template("admin_dictionary.html", entries=entries, token=token, error="Hangul is required (must contain Korean characters).")
 
-    payload = _load_custom_dictionary()
-    entries = payload.get("entries", [])
-    if not isinstance(entries, list):
-        entries = []
-
-    now = int(time.time())
-    updated = False
-    for e in entries:
-        if not isinstance(e, dict):
-            continue
-        if _normalize_english_key(e.get("english") or "") == _normalize_english_key(english):
-            e["english"] = english
-            e["hangul"] = hangul
-            if romanization:
-                e["romanization"] = romanization
-            else:
-                e.pop("romanization", None)
-            if category:
-                e["category"] = category
-            else:
-                e.pop("category", None)
-            e["updated_at"] = now
-            updated = True
-            break
-
-    if not updated:
-        entries.append(
-            {
-                "english": english,
-                "hangul": hangul,
-                "romanization": romanization,
-                "category": category,
-                "created_at": now,
-                "updated_at": now,
-            }
-        )
-
-    payload["schema_version"] = 1
-    payload["entries"] = entries
-    _save_custom_dictionary(payload)
-    # Bust the cached index so new entries are immediately used.
-    try:
-        _english_to_hangul_index.cache_clear()
-    except Exception:
-        pass
+    row = {"english": english, "hangul": hangul, "romanization": romanization, "category": category}
+    _, updated = _storage().upsert_dictionary_entries([row], int(time.time()))
+    _hangul_index().upsert([row])
 
     entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
     notice = "Updated." if updated else "Added."
@@ -1102,20 +3468,8 @@ def admin_dictionary_delete():
     if not english:
         abort(400)
 
-    payload = _load_custom_dictionary()
-    entries = payload.get("entries", [])
-    if not isinstance(entries, list):
-        entries = []
-
-    key = _normalize_english_key(english)
-    entries = [e for e in entries if _normalize_english_key((e or {}).get("english") or "") != key]
-    payload["entries"] = entries
-    payload["schema_version"] = 1
-    _save_custom_dictionary(payload)
-    try:
-        _english_to_hangul_index.cache_clear()
-    except Exception:
-        pass
+    _storage().delete_dictionary_entry(english)
+    _hangul_index().delete(english)
 
     entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
     return render_template("admin_dictionary.html", entries=entries_sorted, token=token, notice="Deleted.")
@@ -1132,119 +3486,70 @@ def admin_dictionary_import():
         entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
         return render_template("admin_dictionary.html", entries=entries_sorted, token=token, error="Please choose a CSV file.")
 
+    job = _create_job("dictionary_import", "admin")
+    upload_path = JOBS_DIR / f"{job['id']}.upload.csv"
     try:
-        raw = f.read()
-        # UTF-8 with BOM supported.
-        text = raw.decode("utf-8-sig", errors="replace")
-    except Exception:
+        f.save(upload_path)
+    except Exception as e:
+        _fail_job(job, f"Could not save the upload: {e}")
+        upload_path.unlink(missing_ok=True)
         entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
         return render_template("admin_dictionary.html", entries=entries_sorted, token=token, error="Could not read CSV.")
 
-    reader = csv.DictReader(io.StringIO(text))
-    # If there's no header, DictReader will treat the first row as header; handle that by falling back.
-    has_header = reader.fieldnames and any(name and name.strip().lower() in {"english", "hangul"} for name in reader.fieldnames)
-    rows = []
-    if has_header:
-        rows = list(reader)
-    else:
-        # Fallback: parse as simple CSV with columns: english,hangul,romanization?,category?
-        simple = csv.reader(io.StringIO(text))
-        for r in simple:
-            if not r or all(not (c or "").strip() for c in r):
-                continue
-            rows.append({
-                "english": r[0] if len(r) > 0 else "",
-                "hangul": r[1] if len(r) > 1 else "",
-                "romanization": r[2] if len(r) > 2 else "",
-                "category": r[3] if len(r) > 3 else "",
-            })
-
-    payload = _load_custom_dictionary()
-    entries = payload.get("entries", [])
-    if not isinstance(entries, list):
-        entries = []
-
-    now = int(time.time())
-    added = 0
-    updated = 0
-    skipped = 0
-
-    def upsert(eng: str, han: str, rom: str, cat: str):
-        nonlocal added, updated, skipped, entries
-        eng = (eng or "").strip()
-        han = _clean_korean_candidate(han or "")
-        rom = (rom or "").strip()
-        cat = (cat or "").strip()
-        if not eng or not _has_hangul(han):
-            skipped += 1
-            return
+    _enqueue_import_job(job, _run_dictionary_import, {"upload_path": str(upload_path)})
+    if _wants_json():
+        return _job_response(job)
+    entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
+    return render_template("admin_dictionary.html", entries=entries_sorted, token=token, notice="Importing CSV…", job=job)
 
-        k = _normalize_english_key(eng)
-        for e in entries:
-            if not isinstance(e, dict):
-                continue
-            if _normalize_english_key(e.get("english") or "") == k:
-                e["english"] = eng
-                e["hangul"] = han
-                if rom:
-                    e["romanization"] = rom
-                else:
-                    e.pop("romanization", None)
-                if cat:
-                    e["category"] = cat
-                else:
-                    e.pop("category", None)
-                e["updated_at"] = now
-                updated += 1
-                return
 
-        entries.append({
-            "english": eng,
-            "hangul": han,
-            "romanization": rom,
-            "category": cat,
-            "created_at": now,
-            "updated_at": now,
-        })
-        added += 1
-
-    for r in rows:
-        if not isinstance(r, dict):
-            continue
-        upsert(r.get("english"), r.get("hangul"), r.get("romanization"), r.get("category"))
+@app.route("/jobs/<job_id>")
+def job_status(job_id: str):
+    """Progress of an import job (JSON); poll until status is "done" or "failed"."""
+    job = _load_job(job_id)
+    if job is None:
+        abort(404)
+    if job.get("owner") == "admin":
+        if not _check_admin_token():
+            abort(403)
+    elif job.get("owner") != _job_owner():
+        abort(404)
+    if _job_is_orphaned(job):
+        job = _fail_job(job, "The server restarted before this import finished. Please run it again.")
+    resp = jsonify({k: job.get(k) for k in _JOB_PUBLIC_FIELDS})
+    resp.headers["Cache-Control"] = "no-store"
+    return resp
 
-    payload["schema_version"] = 1
-    payload["entries"] = entries
-    _save_custom_dictionary(payload)
-    try:
-        _english_to_hangul_index.cache_clear()
-    except Exception:
-        pass
 
-    entries_sorted = sorted(_list_custom_dictionary_entries(), key=lambda e: (e.get("english") or "").lower())
-    notice = f"Imported: {added} added, {updated} updated, {skipped} skipped."
-    return render_template("admin_dictionary.html", entries=entries_sorted, token=token, notice=notice)
+@app.route("/admin/stats")
+def admin_stats():
+    """Process-local cache/reload counters (JSON) for diagnosing the running worker."""
+    if not _check_admin_token():
+        abort(403)
+    index = _hangul_index()
+    return jsonify(
+        {
+            "pid": os.getpid(),
+            "vocab": _vocab_stats(),
+            "belt_pages": {**_BELT_PAGE_STATS, "entries": len(_BELT_PAGE_CACHE)},
+            "storage": _storage().name,
+            "audio": {**_AUDIO_STATS, "pending": len(_AUDIO_JOBS), "workers": len(_AUDIO_WORKERS)},
+            "translation": _translation_stats(),
+            "hangul_index": {**index.stats, "entries": len(index)},
+        }
+    )
 
 
 @app.route("/my-words/delete/<term_id>", methods=["POST"])
 def my_words_delete(term_id):
-    payload = _load_user_terms_data()
-    terms_list = payload.get("terms", [])
-    if not isinstance(terms_list, list):
-        terms_list = []
-
-    terms_list = [t for t in terms_list if t.get("id") != term_id]
-    payload["terms"] = terms_list
-    payload["schema_version"] = 1
-    _save_user_terms_data(payload)
+    _storage().delete_user_term(term_id, _my_words_owner())
 
-    terms = sorted(_list_user_terms(), key=lambda t: t.get("created_at", 0), reverse=True)
-    return render_template("my_words.html", terms=terms, notice="Deleted.")
+    return _render_my_words(notice="Deleted.")
 
 
 @app.route("/my-words/train")
 def my_words_train():
-    terms = _list_user_terms()
+    terms = _list_user_terms(_my_words_owner())
     belt = {
         "belt_id": "my_words",
         "belt_name": "My Words",
@@ -1253,152 +3558,169 @@ def my_words_train():
     }
     belt_color = _get_belt_color(belt)
     belt_tone = "dark" if _is_dark_hex_color(belt_color) else "light"
-    return render_template("terms.html", belt=belt, total_terms=len(terms), belt_tone=belt_tone)
+    return render_template(
+        "terms.html",
+        belt=belt,
+        total_terms=len(terms),
+        belt_tone=belt_tone,
+        terms_url=url_for("belt_terms_json", belt_id="my_words", v=_terms_json_entry(terms)["etag"]),
+    )
 
-@app.route("/audio/<term_id>")
-def get_audio(term_id):
-    """Generate or serve Korean pronunciation audio"""
-    # Ensure directory exists even under gunicorn (where __main__ doesn't run).
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+# Of static/audio only these directories ship with the app. Everything else there is
+# generated (or left over from older layouts) and reaches the service worker via
+# versioned /audio URLs, or not at all.
+_SW_STATIC_AUDIO_DIRS = {"sfx"}
+# Bigger files (the header PNGs) are cached on first use instead of at install time.
+_SW_PRECACHE_MAX_BYTES = 256 * 1024
+_STATIC_REVISIONS: dict[str, tuple] = {}
 
-    mode = (request.args.get("mode") or "bilingual").strip().lower()
-    want_korean_only = mode in {"korean", "ko", "korean_only"}
-    want_english_only = mode in {"english", "en", "english_only"}
 
-    # Keep separate cache files per mode so toggling doesn't overwrite tracks.
-    audio_suffix = ".ko" if want_korean_only else (".en" if want_english_only else "")
-    audio_file = AUDIO_DIR / f"{term_id}{audio_suffix}.mp3"
-    audio_meta = AUDIO_DIR / f"{term_id}{audio_suffix}.meta.json"
+def _static_revision(path: Path) -> str | None:
+    """Content hash of a static file, recomputed only when its mtime/size changes."""
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    cached = _STATIC_REVISIONS.get(str(path))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    revision = hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+    _STATIC_REVISIONS[str(path)] = (stamp, revision)
+    return revision
 
-    data = load_data()
-    term = _find_term_by_id(data, term_id)
-    if not term:
-        user_terms = _list_user_terms()
-        term = _find_user_term_by_id(user_terms, term_id)
-    if not term:
-        abort(404)
 
-    meta = _load_audio_meta(audio_meta)
+def _service_worker_audio_modes() -> list[str]:
+    """WUTA_SW_PRECACHE_AUDIO: comma-separated modes whose ready tracks are precached (default bilingual; "off" for none)."""
+    raw = (os.environ.get("WUTA_SW_PRECACHE_AUDIO") or "bilingual").strip().lower()
+    if raw in {"off", "none", "0", "false", "no"}:
+        return []
+    return sorted({_normalize_audio_mode(m) for m in raw.split(",") if m.strip()})
 
-    # Korean-only mode: generate once and keep it.
-    if want_korean_only:
-        if not audio_file.exists():
-            tmp_file = AUDIO_DIR / f"{term_id}{audio_suffix}.tmp.mp3"
-            try:
-                _generate_korean_only_mp3(term, tmp_file)
-                tmp_file.replace(audio_file)
-                _write_audio_meta(
-                    audio_meta,
-                    {
-                        "schema_version": 2,
-                        "mode": "korean_only",
-                        "term_id": term_id,
-                        "generated_at": int(time.time()),
-                    },
-                )
-            except Exception as e:
-                try:
-                    if tmp_file.exists():
-                        tmp_file.unlink()
-                except Exception:
-                    pass
-                print(f"Error generating Korean-only audio for {term_id}: {e}")
-                abort(500)
 
-        return send_file(audio_file, mimetype="audio/mpeg")
+def _service_worker_precache(snapshot: dict) -> list[dict]:
+    """[{url, revision}] for the service worker: static assets, belt term data, ready audio.
 
-    # English-only mode: generate once and keep it.
-    if want_english_only:
-        if not audio_file.exists():
-            tmp_file = AUDIO_DIR / f"{term_id}{audio_suffix}.tmp.mp3"
-            try:
-                _generate_english_only_mp3(term, tmp_file)
-                tmp_file.replace(audio_file)
-                _write_audio_meta(
-                    audio_meta,
-                    {
-                        "schema_version": 3,
-                        "mode": "english_only",
-                        "term_id": term_id,
-                        "generated_at": int(time.time()),
-                        "prefix": "the word is",
-                    },
-                )
-            except Exception as e:
-                try:
-                    if tmp_file.exists():
-                        tmp_file.unlink()
-                except Exception:
-                    pass
-                print(f"Error generating English-only audio for {term_id}: {e}")
-                abort(500)
+    Pages aren't precached: they show the signed-in user, so they're only cached at
+    runtime (and dropped on sign-in/out).
+    """
+    entries = []
+    for path in sorted(STATIC_DIR.rglob("*")):
+        rel = path.relative_to(STATIC_DIR)
+        if not path.is_file() or rel.parts[0] == "dist":
+            continue
+        if rel.parts[0] == "audio" and (len(rel.parts) < 3 or rel.parts[1] not in _SW_STATIC_AUDIO_DIRS):
+            continue
+        if ".tmp." in path.name or path.stat().st_size > _SW_PRECACHE_MAX_BYTES:
+            continue
+        revision = _static_revision(path)
+        if revision:
+            entries.append({"url": url_for("static", filename=rel.as_posix()), "revision": revision})
 
-        return send_file(audio_file, mimetype="audio/mpeg")
+    for belt_id, view in snapshot["belt_views"].items():
+        terms_json = _belt_terms_json(view)
+        entries.append({"url": url_for("belt_terms_json", belt_id=belt_id, v=terms_json["etag"]), "revision": terms_json["etag"]})
 
-    needs_upgrade = _should_upgrade_audio(audio_file, meta)
+    modes = _service_worker_audio_modes()
+    for belt in snapshot["data"].get("belts", []):
+        for term in belt.get("terms", []):
+            if not term.get("id") or not _has_hangul(term.get("hangul") or ""):
+                continue
+            for mode in modes:
+                key = _audio_track(term, mode)["key"]
+                if _audio_track_path(key).exists():
+                    url = url_for("get_audio", term_id=term["id"], mode=None if mode == "bilingual" else mode, v=key)
+                    entries.append({"url": url, "revision": key})
+    return entries
 
-    if needs_upgrade:
-        tmp_file = AUDIO_DIR / f"{term_id}.tmp.mp3"
-        try:
-            _generate_bilingual_mp3(term, tmp_file)
-
-            # Atomic-ish replace: write temp then replace.
-            tmp_file.replace(audio_file)
-            _write_audio_meta(
-                audio_meta,
-                {
-                    "schema_version": 3,
-                    "mode": "bilingual",
-                    "term_id": term_id,
-                    "generated_at": int(time.time()),
-                    "voice_order": "en_then_ko",
-                    "prefix": "the word is",
-                },
-            )
-        except Exception as e:
-            # Don't clobber an existing file if bilingual generation fails mid-session.
-            try:
-                if tmp_file.exists():
-                    tmp_file.unlink()
-            except Exception:
-                pass
 
-            print(f"Error generating bilingual audio for {term_id}: {e}")
+@app.route("/sw.js")
+def service_worker():
+    """Service worker with a precache list generated from static/, terms.json and the audio cache.
 
-            # If we have no audio at all yet, fall back to Korean-only so the app still works.
-            if not audio_file.exists():
-                try:
-                    _generate_korean_only_mp3(term, audio_file)
-                    _write_audio_meta(
-                        audio_meta,
-                        {
-                            "schema_version": 2,
-                            "mode": "korean_only",
-                            "term_id": term_id,
-                            "generated_at": int(time.time()),
-                            "error": str(e),
-                        },
-                    )
-                except Exception:
-                    abort(500)
-            else:
-                # Keep existing audio, but record that we couldn't upgrade right now.
-                try:
-                    _write_audio_meta(
-                        audio_meta,
-                        {
-                            "schema_version": 2,
-                            "mode": meta.get("mode") if meta else "unknown",
-                            "term_id": term_id,
-                            "generated_at": int(time.time()),
-                            "upgrade_failed": True,
-                            "error": str(e),
-                        },
-                    )
-                except Exception:
-                    pass
-    
-    return send_file(audio_file, mimetype="audio/mpeg")
+    Served from the site root so it controls every page; revalidated on each check, and the
+    worker's cache version changes whenever any precached revision does.
+    """
+    precache = _service_worker_precache(_get_vocab_snapshot())
+    version = hashlib.sha1(json.dumps(precache, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    body = render_template("sw.js", version=version, precache=precache)
+    resp = app.response_class(body, mimetype="application/javascript")
+    resp.set_etag(version)
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
+
+
+AUDIO_IMMUTABLE_MAX_AGE = 31536000
+
+
+def _send_audio(path: Path, key: str, requested_key: str | None, *, mimetype: str = "audio/mpeg", download_name: str | None = None):
+    """send_file with a strong ETag from the track key (Range and If-None-Match → 206/304).
+
+    A URL whose ?v= matches the track key names those exact bytes forever, so it is
+    cached as immutable; unversioned or outdated URLs revalidate every time.
+    """
+    if requested_key == key:
+        resp = send_file(path, mimetype=mimetype, as_attachment=bool(download_name), download_name=download_name, etag=key, max_age=AUDIO_IMMUTABLE_MAX_AGE)
+        resp.cache_control.immutable = True
+    else:
+        resp = send_file(path, mimetype=mimetype, as_attachment=bool(download_name), download_name=download_name, etag=key, max_age=None)
+        resp.cache_control.no_cache = True
+    return resp
+
+
+@app.route("/audio/<term_id>")
+def get_audio(term_id):
+    """Serve pronunciation audio, generating it on the background workers if needed.
+
+    Waits up to WUTA_AUDIO_WAIT_SECONDS (default 10) for a missing track; after that it
+    serves an older/fallback track if one exists, else 202 with Retry-After.
+    Pass ?v=<track key> (see _audio_versions) to get a long-lived immutable response.
+    """
+    mode = _normalize_audio_mode(request.args.get("mode"))
+    requested_key = request.args.get("v") or None
+    term = _find_term_by_id(term_id) or _find_user_term_by_id(term_id)
+    if not term:
+        abort(404)
+
+    try:
+        track = _audio_track(term, mode)
+    except ValueError as e:
+        print(f"Error generating {mode} audio for {term_id}: {e}")
+        abort(500)
+    audio_file = _audio_track_path(track["key"])
+    if audio_file.exists():
+        return _send_audio(audio_file, track["key"], requested_key)
+
+    fut = _enqueue_audio_job(term_id, term, mode)
+    try:
+        wait_seconds = float(os.environ.get("WUTA_AUDIO_WAIT_SECONDS") or 10)
+    except ValueError:
+        wait_seconds = 10.0
+    fallback = None
+    try:
+        path = fut.result(timeout=max(0.0, wait_seconds))
+        if path == audio_file:
+            return _send_audio(audio_file, track["key"], requested_key)
+        # Bilingual assembly failed and we got the Korean-only track instead.
+        fallback = path
+    except TimeoutError:
+        # Still running here, or another worker holds the generation lock.
+        pass
+    except Exception:
+        pass
+
+    # The track generated before the term was edited is better than nothing.
+    fallback = fallback or _previous_audio_track(term_id, mode)
+    if fallback is not None:
+        resp = send_file(fallback, mimetype="audio/mpeg")
+        # Outdated/fallback track while the real one is pending: don't let clients keep it.
+        resp.cache_control.no_store = True
+        return resp
+    if fut.done():
+        abort(500)
+
+    resp = jsonify({"status": "pending", "term_id": term_id, "mode": mode})
+    resp.status_code = 202
+    resp.headers["Retry-After"] = "2"
+    return resp
 
 if __name__ == "__main__":
     AUDIO_DIR.mkdir(parents=True, exist_ok=True)
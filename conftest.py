@@ -0,0 +1,82 @@
+"""Shared pytest setup: offline providers, and all of the app's writable state in a temp dir.
+
+Every test gets this automatically, and monkeypatch undoes it afterwards, so no
+setting leaks from one test module into the next. Tests run against the default
+JSON storage; tests that take the `storage` fixture run once per backend.
+"""
+import threading
+import time
+
+import pytest
+
+import app as wuta
+
+ADMIN_TOKEN = "test-token"
+
+
+@pytest.fixture(autouse=True)
+def isolated_app(monkeypatch, tmp_path):
+    monkeypatch.setenv("WUTA_TTS_PROVIDER", "stub")
+    monkeypatch.setenv("WUTA_TRANSLATION_PROVIDER", "stub")
+    monkeypatch.setenv("WUTA_AUDIO_PREGENERATE", "off")
+    monkeypatch.setenv("WUTA_ADMIN_TOKEN", ADMIN_TOKEN)
+
+    monkeypatch.setattr(wuta, "AUDIO_DIR", tmp_path / "audio")
+    monkeypatch.setattr(wuta, "JOBS_DIR", tmp_path / "jobs")
+    monkeypatch.setattr(wuta, "VOCAB_HISTORY_DIR", tmp_path / "vocab_history")
+    monkeypatch.setattr(wuta, "USERS_PATH", tmp_path / "users.json")
+    monkeypatch.setattr(wuta, "USER_TERMS_PATH", tmp_path / "user_terms.json")
+    monkeypatch.setattr(wuta, "CUSTOM_DICT_PATH", tmp_path / "custom_dictionary.json")
+    for cache in ("_USERS_CACHE", "_USER_TERMS_CACHE", "_CUSTOM_DICT_CACHE"):
+        monkeypatch.setattr(wuta, cache, None)
+
+    monkeypatch.setattr(wuta, "_STORAGE", wuta.JsonStorage())
+    monkeypatch.setattr(wuta, "_HANGUL_INDEX", wuta.HangulIndex(tmp_path / "dictionary.stamp"))
+    monkeypatch.setattr(wuta, "_TRANSLATION_CACHE", wuta.TranslationCache(tmp_path / "translation_cache.db"))
+    monkeypatch.setattr(wuta, "_TRANSLATION_LIMITER", wuta.TokenBucket(rate=1000, capacity=1000))
+    return tmp_path
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def storage(request, monkeypatch, isolated_app):
+    """The app's storage backend, once as JsonStorage and once as SqliteStorage."""
+    store = wuta.JsonStorage() if request.param == "json" else wuta.SqliteStorage(isolated_app / "wuta.db")
+    monkeypatch.setattr(wuta, "_STORAGE", store)
+    return store
+
+
+class CallLog(list):
+    """Arguments of each call a counting fixture saw. Set `delay` to slow every call
+    down (to widen races)."""
+
+    delay = 0.0
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def wrap(self, real, record):
+        def counting(*args, **kwargs):
+            with self._lock:
+                self.append(record(*args, **kwargs))
+            if self.delay:
+                time.sleep(self.delay)
+            return real(*args, **kwargs)
+        return counting
+
+
+@pytest.fixture
+def tts_calls(monkeypatch):
+    """(text, lang, slow) for every TTS call."""
+    calls = CallLog()
+    record = lambda text, lang, slow=False: (text, lang, slow)  # noqa: E731
+    monkeypatch.setattr(wuta, "_tts_mp3_bytes", calls.wrap(wuta._tts_mp3_bytes, record))
+    return calls
+
+
+@pytest.fixture
+def translation_calls(monkeypatch):
+    """The text of every call to the stub translation provider."""
+    calls = CallLog()
+    monkeypatch.setitem(wuta._ONLINE_TRANSLATORS, "stub", calls.wrap(wuta._ONLINE_TRANSLATORS["stub"], lambda text: text))
+    return calls
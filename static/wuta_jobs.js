@@ -0,0 +1,56 @@
+(function () {
+    'use strict';
+
+    // Import/repair job progress for WUTA Taekwondo Vocabulary Study App.
+    //
+    // Imports and repairs run in the background; the page shows an element with
+    // data-job-url (the /jobs/<id> status URL) and data-done-url (where to go once
+    // the job has finished). This polls the job and keeps the element's text current.
+
+    const POLL_MS = 1000;
+
+    function _describe(job) {
+        const total = job.total == null ? '?' : job.total;
+        const parts = [`Processed ${job.processed} / ${total}`];
+        if (job.added || job.kind !== 'my_words_repair') parts.push(`${job.added} added`);
+        if (job.updated) parts.push(`${job.updated} updated`);
+        if (job.skipped) parts.push(`${job.skipped} skipped`);
+        if (job.failed) parts.push(`${job.failed} failed`);
+        return parts.join(' · ');
+    }
+
+    function _watch(el) {
+        const jobUrl = el.dataset.jobUrl;
+        const doneUrl = el.dataset.doneUrl || window.location.pathname;
+
+        async function poll() {
+            let job = null;
+            try {
+                const resp = await fetch(jobUrl, { credentials: 'same-origin', cache: 'no-store' });
+                if (resp.ok) job = await resp.json();
+            } catch (e) {
+                // Network hiccup: try again on the next tick.
+            }
+            if (!job) {
+                setTimeout(poll, POLL_MS * 3);
+                return;
+            }
+            const repair = job.kind === 'my_words_repair';
+            if (job.status === 'done' || job.status === 'failed') {
+                el.textContent = job.status === 'done'
+                    ? (job.message || (repair ? 'Repair finished.' : 'Import finished.'))
+                    : `${repair ? 'Repair' : 'Import'} failed: ${job.error || 'unknown error'}`;
+                if (job.status === 'done') setTimeout(() => { window.location.href = doneUrl; }, 1200);
+                return;
+            }
+            el.textContent = job.status === 'queued'
+                ? `${repair ? 'Repair' : 'Import'} queued…`
+                : `${repair ? 'Repairing' : 'Importing'}… ${_describe(job)}`;
+            setTimeout(poll, POLL_MS);
+        }
+
+        poll();
+    }
+
+    document.querySelectorAll('[data-job-url]').forEach(_watch);
+})();
@@ -0,0 +1,161 @@
+// WUTA service worker (generated by /sw.js; the precache list comes from the server).
+const VERSION = {{ version | tojson }};
+const PRECACHE = {{ precache | tojson }};
+
+const PRECACHE_NAME = `wuta-precache-${VERSION}`;
+const PAGES_CACHE = 'wuta-pages';
+const AUDIO_CACHE = 'wuta-audio';
+const STATIC_CACHE = 'wuta-static';
+const DATA_CACHE = 'wuta-data';
+const MANIFEST_KEY = '/__wuta-precache-manifest';
+
+// Signing in/out changes what pages show (header, My Words count), so cached pages are
+// dropped whenever one of these requests (GET or POST) completes.
+const AUTH_PATHS = ['/login', '/logout', '/register', '/account/delete'];
+
+// Install: copy entries whose revision didn't change from the previous precache,
+// fetch only the rest.
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE_NAME);
+        const previous = await _previousPrecache();
+        await Promise.all(PRECACHE.map(async (entry) => {
+            if (previous && previous.revisions[entry.url] === entry.revision) {
+                const hit = await previous.cache.match(entry.url);
+                if (hit) return cache.put(entry.url, hit);
+            }
+            try {
+                const resp = await fetch(new Request(entry.url, { cache: 'reload', credentials: 'same-origin' }));
+                if (resp.ok && resp.status === 200) await cache.put(entry.url, resp);
+            } catch (e) {
+                // Offline during install: the entry is fetched on first use instead.
+            }
+        }));
+        const revisions = {};
+        PRECACHE.forEach((entry) => { revisions[entry.url] = entry.revision; });
+        await cache.put(MANIFEST_KEY, new Response(JSON.stringify(revisions), { headers: { 'Content-Type': 'application/json' } }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        const names = await caches.keys();
+        await Promise.all(names
+            .filter((name) => name.startsWith('wuta-precache-') && name !== PRECACHE_NAME)
+            .map((name) => caches.delete(name)));
+        // Pages from the previous version may embed an older vocabulary.
+        await caches.delete(PAGES_CACHE);
+        await self.clients.claim();
+    })());
+});
+
+async function _previousPrecache() {
+    const names = (await caches.keys()).filter((name) => name.startsWith('wuta-precache-') && name !== PRECACHE_NAME);
+    for (const name of names) {
+        const cache = await caches.open(name);
+        const resp = await cache.match(MANIFEST_KEY);
+        if (resp) return { cache, revisions: await resp.json() };
+    }
+    return null;
+}
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (AUTH_PATHS.includes(url.pathname)) {
+        // Purge once the server has handled it, before the browser follows the redirect.
+        event.respondWith(fetch(request).finally(_forgetPages));
+        return;
+    }
+    if (request.method !== 'GET') return;
+    if (url.pathname.startsWith('/audio/') && url.searchParams.has('v')) {
+        event.respondWith(_cacheFirst(request, AUDIO_CACHE));
+        return;
+    }
+    if (/^\/api\/belts\/[^/]+\/terms\.json$/.test(url.pathname) && url.searchParams.has('v')) {
+        event.respondWith(_cacheFirst(request, DATA_CACHE));
+        return;
+    }
+    if (url.pathname.startsWith('/static/')) {
+        event.respondWith(_staleWhileRevalidate(request, STATIC_CACHE));
+        return;
+    }
+    if (_isPage(url.pathname)) {
+        event.respondWith(_staleWhileRevalidate(request, PAGES_CACHE));
+    }
+});
+
+function _isPage(pathname) {
+    return pathname === '/' || /^\/belts\/[^/]+$/.test(pathname);
+}
+
+async function _forgetPages() {
+    await caches.delete(PAGES_CACHE);
+}
+
+async function _matchPrecache(request) {
+    const cache = await caches.open(PRECACHE_NAME);
+    return cache.match(request, { ignoreVary: true });
+}
+
+async function _staleWhileRevalidate(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const cached = (await cache.match(request, { ignoreVary: true })) || (await _matchPrecache(request));
+    const network = fetch(request)
+        .then((resp) => {
+            if (resp.ok && resp.status === 200) cache.put(request, resp.clone());
+            return resp;
+        })
+        .catch(() => null);
+    if (cached) return cached;
+    return (await network) || Response.error();
+}
+
+// Versioned audio and term-data URLs never change content, so the cache is the source
+// of truth. Media elements send Range requests (iOS Safari always does): store the full
+// clip, then answer ranges from it.
+async function _cacheFirst(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const key = request.url;
+    let resp = (await cache.match(key)) || (await _matchPrecache(key));
+    if (!resp) {
+        resp = await fetch(key, { credentials: 'same-origin' });
+        if (resp.status !== 200) return resp;
+        await cache.put(key, resp.clone());
+    }
+    const range = request.headers.get('Range');
+    return range ? _rangeResponse(resp, range) : resp;
+}
+
+async function _rangeResponse(resp, rangeHeader) {
+    const body = await resp.arrayBuffer();
+    const size = body.byteLength;
+    const m = /^bytes=(\d*)-(\d*)$/.exec(rangeHeader.trim());
+    if (!m || (m[1] === '' && m[2] === '')) {
+        return new Response(null, { status: 416, headers: { 'Content-Range': `bytes */${size}` } });
+    }
+    let start;
+    let end;
+    if (m[1] === '') {
+        start = Math.max(0, size - Number(m[2]));
+        end = size - 1;
+    } else {
+        start = Number(m[1]);
+        end = m[2] === '' ? size - 1 : Math.min(Number(m[2]), size - 1);
+    }
+    if (start >= size || start > end) {
+        return new Response(null, { status: 416, headers: { 'Content-Range': `bytes */${size}` } });
+    }
+    return new Response(body.slice(start, end + 1), {
+        status: 206,
+        headers: {
+            'Content-Type': resp.headers.get('Content-Type') || 'audio/mpeg',
+            'Content-Range': `bytes ${start}-${end}/${size}`,
+            'Content-Length': String(end - start + 1),
+            'Accept-Ranges': 'bytes',
+        },
+    });
+}
@@ -0,0 +1,69 @@
+"""Test MP3 frame splicing and that all three audio modes of a term share their TTS clips.
+"""
+import app as wuta
+
+TERM_ID = "taekwondo"
+
+
+def test_concat_inserts_matching_silence_frames():
+    english = wuta._stub_tts_mp3("The word is Taekwondo.")
+    korean = wuta._stub_tts_mp3("태권도", slow=True)
+    # Leading ID3 tag and trailing ID3v1 tag must not end up in the middle of the track.
+    tagged = b"ID3\x04\x00\x00\x00\x00\x00\x05hello" + english + b"TAG" + bytes(125)
+
+    joined = wuta._concat_mp3_clips([tagged, korean], 650)
+
+    frames = wuta._mp3_frames(joined)
+    assert frames is not None
+    # 650 ms at 24 kHz with 576 samples/frame rounds up to 28 frames.
+    assert len(frames) == len(english) // 96 + 28 + len(korean) // 96
+    assert len({info["encoding"] for _, info in frames}) == 1
+
+
+def test_concat_refuses_mismatched_encodings():
+    mono_24k = wuta._stub_tts_mp3("a")
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames.
+    stereo_44k = (b"\xff\xfb\x90\x00" + bytes(413)) * 4
+    assert wuta._concat_mp3_clips([mono_24k, stereo_44k], 650) is None
+    assert wuta._concat_mp3_clips([mono_24k, b"not an mp3"], 650) is None
+
+
+def test_switching_modes_reuses_cached_clips(tts_calls):
+    term = wuta._find_term_by_id(TERM_ID)
+    paths = {mode: wuta._ensure_audio(TERM_ID, term, mode) for mode in ("bilingual", "korean", "english")}
+
+    assert len(tts_calls) == 2, tts_calls
+    assert len(set(paths.values())) == 3
+
+
+def test_track_key_for_untranslated_term_needs_no_translation(monkeypatch):
+    term = {"english": "Ice Cream Sandwich", "romanization": "aiseukeurim"}
+
+    def no_network(english):
+        raise AssertionError("cache key lookup must not translate")
+
+    monkeypatch.setattr(wuta, "_best_effort_hangul_for_english", no_network)
+    track = wuta._audio_track(term, "bilingual")
+    assert not wuta._audio_is_ready(term, "bilingual")
+
+    # Translation fails: a stand-in is served, but nothing is stored under the key.
+    monkeypatch.setattr(wuta, "_best_effort_hangul_for_english", lambda english: "")
+    stand_in = wuta._ensure_audio("ice-cream", term, "bilingual")
+    assert stand_in.exists() and stand_in != wuta._audio_track_path(track["key"])
+
+    monkeypatch.setattr(wuta, "_best_effort_hangul_for_english", lambda english: "아이스크림 샌드위치")
+    assert wuta._ensure_audio("ice-cream", term, "bilingual") == wuta._audio_track_path(track["key"])
+
+
+def test_purge_legacy_audio_keeps_the_current_layout():
+    term = wuta._find_term_by_id(TERM_ID)
+    track = wuta._ensure_audio(TERM_ID, term, "korean")
+    sfx = wuta.AUDIO_DIR / "sfx" / "ding.mp3"
+    sfx.parent.mkdir(parents=True)
+    sfx.write_bytes(b"sfx")
+    for name in (f"{TERM_ID}.mp3", f"{TERM_ID}.meta.json", f"{TERM_ID}_korean.mp3"):
+        (wuta.AUDIO_DIR / name).write_bytes(b"old")
+
+    assert wuta._purge_legacy_audio() == 3
+    assert track.exists() and sfx.exists()
+    assert not [p for p in wuta.AUDIO_DIR.iterdir() if p.is_file()]
@@ -0,0 +1,57 @@
+"""Test that concurrent requests for one uncached term synthesize its audio exactly once.
+"""
+import threading
+
+import pytest
+
+import app as wuta
+
+PARALLEL_REQUESTS = 12
+TERM_ID = "taekwondo"
+
+
+@pytest.fixture
+def slow_tts_calls(tts_calls):
+    """TTS calls, each one slowed down to widen the race."""
+    tts_calls.delay = 0.3
+    return tts_calls
+
+
+def _run_parallel(target):
+    start = threading.Barrier(PARALLEL_REQUESTS)
+    results = [None] * PARALLEL_REQUESTS
+
+    def worker(i):
+        start.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(PARALLEL_REQUESTS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=60)
+    return results
+
+
+def test_parallel_audio_requests_synthesize_once(monkeypatch, slow_tts_calls):
+    monkeypatch.setenv("WUTA_AUDIO_WAIT_SECONDS", "30")
+
+    def fetch():
+        resp = wuta.app.test_client().get(f"/audio/{TERM_ID}?mode=korean")
+        return resp.status_code, len(resp.data)
+
+    results = _run_parallel(fetch)
+
+    assert all(status == 200 and size > 0 for status, size in results), results
+    assert len(slow_tts_calls) == 1, slow_tts_calls
+
+
+def test_parallel_generation_across_workers_synthesizes_once(slow_tts_calls):
+    # Calling _ensure_audio directly skips the in-process job queue, like separate
+    # gunicorn workers would; only the file lock keeps them from duplicating work.
+    term = wuta._find_term_by_id(TERM_ID)
+    results = _run_parallel(lambda: wuta._ensure_audio(TERM_ID, term, "korean"))
+
+    assert len(slow_tts_calls) == 1, slow_tts_calls
+    assert len(set(results)) == 1 and results[0].exists()
+    assert not list(wuta.AUDIO_DIR.rglob("*.tmp.mp3"))
@@ -0,0 +1,50 @@
+"""Test the cached belt pages, the compact terms.json payload and the service worker precache list."""
+import collections
+
+import app as wuta
+
+BELT_ID = "white"
+
+
+def test_belt_page_is_cached_once_for_guests_and_users(monkeypatch):
+    monkeypatch.setattr(wuta, "_BELT_PAGE_CACHE", collections.OrderedDict())
+    monkeypatch.setitem(wuta._BELT_PAGE_STATS, "misses", 0)
+    snapshot = wuta._get_vocab_snapshot()
+    view = snapshot["belt_views"][BELT_ID]
+    student = {"id": "u1", "username": "minji"}
+
+    with wuta.app.test_request_context(f"/belts/{BELT_ID}"):
+        guest = wuta._render_belt_page(view, snapshot, None)
+        signed_in = wuta._render_belt_page(view, snapshot, student)
+        assert signed_in["body"] == wuta._belt_page_body(view, student)
+        assert wuta._render_belt_page(view, snapshot, None)["body"] == guest["body"]
+
+    assert b"minji" in signed_in["body"] and b"minji" not in guest["body"]
+    assert signed_in["etag"] != guest["etag"]
+    assert wuta._BELT_PAGE_STATS["misses"] == 1
+    assert list(wuta._BELT_PAGE_CACHE) == [(BELT_ID, snapshot["version"])]
+
+
+def test_service_worker_precaches_only_shipped_static_audio(monkeypatch, tmp_path):
+    static = tmp_path / "static"
+    for name in ("css/app.css", "audio/sfx/ding.mp3", "audio/taekwondo.mp3", "audio/taekwondo.meta.json", "audio/tracks/ab/abc.mp3"):
+        (static / name).parent.mkdir(parents=True, exist_ok=True)
+        (static / name).write_bytes(b"x")
+    monkeypatch.setattr(wuta, "STATIC_DIR", static)
+    monkeypatch.setenv("WUTA_SW_PRECACHE_AUDIO", "off")
+
+    with wuta.app.test_request_context("/sw.js"):
+        urls = [e["url"] for e in wuta._service_worker_precache(wuta._get_vocab_snapshot())]
+    assert [u for u in urls if "/static/" in u] == ["/static/audio/sfx/ding.mp3", "/static/css/app.css"]
+
+
+def test_terms_json_serves_terms_missing_an_audio_mode(storage):
+    # A legacy My Words entry with neither English nor Hangul has no Korean-only track.
+    storage.add_user_terms([{"id": "u_legacy", "english": "", "hangul": "", "romanization": "annyeong", "created_at": 1, "source": "user"}])
+
+    resp = wuta.app.test_client().get("/api/belts/my_words/terms.json")
+    assert resp.status_code == 200
+    payload = resp.get_json()
+    row = dict(zip(payload["k"], payload["t"][0]))
+    audio = dict(zip(payload["m"], row["audio"]))
+    assert audio["korean"] is None and audio["bilingual"]
@@ -0,0 +1,77 @@
+"""Test the indexed custom dictionary upsert/delete and the English -> Hangul index across workers.
+"""
+import json
+import os
+import time
+
+import app as wuta
+
+
+def test_json_upsert_matches_normalized_keys_and_tracks_external_writes():
+    store = wuta.JsonStorage()
+    rows = [
+        {"english": "Ice Cream Sandwich", "hangul": "아이스크림"},
+        {"english": "ice-cream   sandwich!", "hangul": "아이스크림 샌드위치"},
+        {"english": "Spoon", "hangul": "숟가락"},
+    ]
+    assert store.upsert_dictionary_entries(rows, 100) == (2, 1)
+    entries = store.list_dictionary_entries()
+    assert [e["english"] for e in entries] == ["ice-cream   sandwich!", "Spoon"]
+    assert entries[0]["hangul"] == "아이스크림 샌드위치"
+    # Callers get copies; editing one doesn't reach the cached index.
+    entries[0]["hangul"] = "changed"
+    assert store.list_dictionary_entries()[0]["hangul"] == "아이스크림 샌드위치"
+
+    # Another worker rewrites the file: the index follows the new stamp.
+    payload = json.loads(wuta.CUSTOM_DICT_PATH.read_text(encoding="utf-8"))
+    payload["entries"].append({"english": "Fork", "hangul": "포크", "created_at": 1, "updated_at": 1})
+    time.sleep(0.01)
+    wuta.CUSTOM_DICT_PATH.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    assert store.upsert_dictionary_entries([{"english": "FORK", "hangul": "포오크"}], 200) == (0, 1)
+
+    store.delete_dictionary_entry("spoon")
+    on_disk = json.loads(wuta.CUSTOM_DICT_PATH.read_text(encoding="utf-8"))["entries"]
+    assert [(e["english"], e["hangul"]) for e in on_disk] == [
+        ("ice-cream   sandwich!", "아이스크림 샌드위치"),
+        ("FORK", "포오크"),
+    ]
+
+
+def test_hangul_index_updates_incrementally_and_across_workers(tmp_path, storage):
+    canonical = wuta._lookup_hangul_from_vocab("Front Kick")
+    assert canonical
+    # Two gunicorn workers: separate in-memory indexes, one shared stamp file.
+    worker_a = wuta.HangulIndex(tmp_path / "dictionary.stamp")
+    worker_b = wuta.HangulIndex(tmp_path / "dictionary.stamp")
+    assert worker_a.lookup("front kick") == worker_b.lookup("front kick") == canonical
+
+    row = {"english": "Front Kick", "hangul": "앞 차기"}
+    storage.upsert_dictionary_entries([row], 100)
+    worker_a.upsert([row])
+    assert worker_a.lookup("FRONT KICK!") == "앞 차기"
+    assert worker_a.stats["custom_reloads"] == 1  # the initial load; the upsert was patched in
+    assert worker_b.lookup("front kick") == "앞 차기"
+    assert worker_b.stats["custom_reloads"] == 2
+
+    storage.delete_dictionary_entry("front kick")
+    worker_b.delete("front kick")
+    assert worker_b.lookup("front kick") == canonical
+    assert worker_a.lookup("front kick") == canonical
+    assert worker_a.stats["canonical_builds"] == worker_b.stats["canonical_builds"] == 1
+
+
+def test_bumps_with_identical_file_stamp_still_propagate(tmp_path, storage):
+    stamp_path = tmp_path / "dictionary.stamp"
+    worker_a = wuta.HangulIndex(stamp_path)
+    worker_b = wuta.HangulIndex(stamp_path)
+    worker_a.upsert([])
+    assert worker_b.lookup("front kick")
+    before = os.stat(stamp_path)
+
+    # A coarse-mtime filesystem: the next bump keeps the same mtime and size (1 -> 2).
+    row = {"english": "Front Kick", "hangul": "앞 차기"}
+    storage.upsert_dictionary_entries([row], 100)
+    worker_a.upsert([row])
+    os.utime(stamp_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert wuta._file_stamp(stamp_path) == (before.st_mtime_ns, before.st_size)
+    assert worker_b.lookup("front kick") == "앞 차기"
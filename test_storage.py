@@ -0,0 +1,93 @@
+"""Test that the JSON and SQLite storage backends behave the same, and the JSON -> SQLite migrator."""
+import app as wuta
+
+
+def _user(n, username):
+    return {"id": f"u{n}", "username": username, "email": f"{username.lower()}@example.com", "password_hash": "x", "created_at": n}
+
+
+def _term(n, owner, english):
+    # Like _create_user_term: guest terms carry no user_id at all.
+    term = {"id": f"t{n}", "english": english, "hangul": f"말{n}", "created_at": n, "source": "user"}
+    if owner:
+        term["user_id"] = owner
+    return term
+
+
+def _ids(terms):
+    return [t["id"] for t in terms]
+
+
+def test_users(storage):
+    assert storage.add_user(_user(1, "Minji")) is None
+    assert storage.add_user(_user(2, "MINJI")) == "username"
+    assert storage.add_user({**_user(3, "Jisoo"), "email": "minji@example.com"}) == "email"
+    assert storage.add_user(_user(4, "Jisoo")) is None
+
+    assert storage.find_user_by_id("u1") == _user(1, "Minji")
+    assert storage.find_user_by_username("minji")["id"] == "u1"
+    assert storage.find_user_by_email("jisoo@example.com")["id"] == "u4"
+    assert storage.find_user_by_id("u2") is None
+
+    storage.add_user_terms([_term(1, "u1", "Spoon"), _term(2, "u4", "Fork")])
+    storage.delete_user("u1")
+    assert storage.find_user_by_username("Minji") is None
+    assert storage.find_user_term("t1") is None
+    assert storage.find_user_term("t2")["user_id"] == "u4"
+
+
+def test_my_words(storage):
+    storage.add_user_terms([_term(1, "u1", "Spoon"), _term(3, None, "Cup"), _term(2, "u1", "Fork"), _term(4, "u1", "Knife")])
+
+    assert _ids(storage.list_user_terms("u1")) == ["t1", "t2", "t4"]
+    assert _ids(storage.list_user_terms(None)) == ["t3"]
+    assert _ids(storage.page_user_terms("u1", limit=2)) == ["t4", "t2"]
+    assert _ids(storage.page_user_terms("u1", limit=2, offset=2)) == ["t1"]
+    assert storage.count_user_terms("u1") == 3 and storage.count_user_terms("nobody") == 0
+    assert storage.find_user_term("t2") == _term(2, "u1", "Fork")
+
+    storage.update_user_terms({"t2": {"hangul": "포크", "romanization": "pokeu"}})
+    assert storage.find_user_term("t2") == {**_term(2, "u1", "Fork"), "hangul": "포크", "romanization": "pokeu"}
+
+    # Deletes are scoped to the owner.
+    storage.delete_user_term("t2", None)
+    assert storage.find_user_term("t2") is not None
+    storage.delete_user_term("t2", "u1")
+    assert _ids(storage.list_user_terms("u1")) == ["t1", "t4"]
+
+
+def test_custom_dictionary(storage):
+    rows = [
+        {"english": "Ice Cream", "hangul": "아이스크림", "romanization": "aiseukeurim"},
+        {"english": "Spoon", "hangul": "숟가락", "category": "kitchen"},
+        {"english": "ice-cream!", "hangul": "아이스 크림"},
+    ]
+    assert storage.upsert_dictionary_entries(rows, 100) == (2, 1)
+    assert storage.upsert_dictionary_entries([{"english": "SPOON", "hangul": "수저"}], 200) == (0, 1)
+    storage.delete_dictionary_entry("nothing here")
+    storage.delete_dictionary_entry(" ice cream ")
+    storage.upsert_dictionary_entries([{"english": "Fork", "hangul": "포크"}], 300)
+
+    # Insertion order; updates keep an entry's place.
+    assert storage.list_dictionary_entries() == [
+        {"english": "SPOON", "hangul": "수저", "created_at": 100, "updated_at": 200},
+        {"english": "Fork", "hangul": "포크", "romanization": "", "category": "", "created_at": 300, "updated_at": 300},
+    ]
+
+
+def test_migration_copies_json_data_into_sqlite(tmp_path):
+    json_store = wuta._storage()
+    json_store.add_user(_user(1, "Minji"))
+    json_store.add_user_terms([_term(1, "u1", "Spoon"), _term(2, None, "Cup")])
+    json_store.upsert_dictionary_entries([{"english": "Fork", "hangul": "포크", "category": "kitchen"}], 100)
+
+    db_path = tmp_path / "migrated.db"
+    assert wuta._migrate_json_to_sqlite(db_path) == {"users": 1, "user_terms": 2, "dictionary_entries": 1}
+    # Re-running keeps what is already there.
+    assert wuta._migrate_json_to_sqlite(db_path) == {"users": 0, "user_terms": 0, "dictionary_entries": 0}
+
+    sqlite_store = wuta.SqliteStorage(db_path)
+    assert sqlite_store.find_user_by_username("minji") == json_store.find_user_by_id("u1")
+    for owner in ("u1", None):
+        assert sqlite_store.list_user_terms(owner) == json_store.list_user_terms(owner)
+    assert sqlite_store.list_dictionary_entries() == json_store.list_dictionary_entries()
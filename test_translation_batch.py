@@ -0,0 +1,34 @@
+"""Test batch translation: dedupe, dictionary-first, pooled lookups and the rate limiter.
+"""
+import time
+
+import app as wuta
+
+
+def test_batch_dedupes_and_skips_provider_for_vocab_hits(translation_calls):
+    translation_calls.delay = 0.2
+    phrases = [f"practice word {n}" for n in range(8)] + ["Practice Word 0!", "Front Kick", ""]
+    started = time.monotonic()
+    results = dict(wuta._translate_batch(phrases))
+    elapsed = time.monotonic() - started
+
+    assert sorted(results) == list(range(len(phrases)))
+    assert results[8] == results[0] and results[0]
+    assert results[9] == wuta._lookup_hangul_from_vocab("Front Kick")
+    assert results[10] == ""
+    # 8 distinct unknown phrases, looked up once each, in parallel.
+    assert len(translation_calls) == 8
+    assert elapsed < 8 * 0.2
+
+
+def test_token_bucket_limits_rate():
+    bucket = wuta.TokenBucket(rate=20, capacity=2)
+    started = time.monotonic()
+    for _ in range(6):
+        assert bucket.acquire(timeout=5)
+    # 2 from the burst, 4 more at 20/s.
+    assert time.monotonic() - started >= 0.15
+
+    slow = wuta.TokenBucket(rate=0.01, capacity=1)
+    assert slow.acquire(timeout=0)
+    assert not slow.acquire(timeout=0)
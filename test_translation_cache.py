@@ -0,0 +1,36 @@
+"""Test the persistent translation cache: hits, negative caching and expiry.
+"""
+import app as wuta
+
+
+def test_repeated_phrase_is_translated_once(translation_calls):
+    first = wuta._best_effort_hangul_for_english("Ice Cream Sandwich")
+    # Same phrase after _normalize_english_key: case/spacing/punctuation don't matter.
+    again = wuta._best_effort_hangul_for_english("  ice cream, sandwich! ")
+
+    assert first and wuta._has_hangul(first)
+    assert again == first
+    assert translation_calls == ["Ice Cream Sandwich"]
+
+
+def test_misses_are_cached_until_negative_ttl_expires(translation_calls):
+    assert wuta._translate_cached("12345", "stub") is None
+    assert wuta._translate_cached("12345", "stub") is None
+    assert len(translation_calls) == 1
+
+    cache = wuta._translation_cache()
+    key = wuta._normalize_english_key("12345")
+    _, negative_ttl = wuta._translation_ttls()
+    later = wuta.time.time() + negative_ttl + 1
+    assert cache.get("stub", key, now=int(later)) == (False, None)
+    assert cache.purge_expired(now=int(later)) == 1
+
+
+def test_expired_rows_are_purged_while_writing(tmp_path):
+    cache = wuta.TranslationCache(tmp_path / "purge.db", purge_every=3)
+    cache.put("stub", "old", None, ttl=10, now=100)
+    cache.put("stub", "kept", "유지", ttl=1000, now=100)
+    # Third put, long after "old" expired, triggers the purge.
+    cache.put("stub", "new", None, ttl=10, now=500)
+    rows = cache._conn().execute("SELECT key FROM translations ORDER BY key").fetchall()
+    assert [r[0] for r in rows] == ["kept", "new"]
@@ -0,0 +1,53 @@
+"""Test /api/v1/vocab: field projection, ?since= deltas and the full-body fallback."""
+import json
+
+import app as wuta
+
+OLD_VERSION = "0123456789ab"
+
+
+def _save_history(version, digests):
+    wuta.VOCAB_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    (wuta.VOCAB_HISTORY_DIR / f"{version}.json").write_text(json.dumps({"version": version, "terms": digests}), encoding="utf-8")
+
+
+def test_fields_are_projected_and_unknown_fields_rejected():
+    client = wuta.app.test_client()
+    body = client.get("/api/v1/vocab?fields=hangul, english").get_json()
+    assert body["full"] is True and body["fields"] == ["id", "hangul", "english"]
+    assert body["terms"] and all(set(t) <= {"id", "hangul", "english"} and "id" in t for t in body["terms"])
+
+    resp = client.get("/api/v1/vocab?fields=hangul,secret")
+    assert resp.status_code == 400
+    assert resp.get_json()["fields"] == ["secret"]
+
+
+def test_since_returns_a_delta_against_the_saved_version(monkeypatch):
+    monkeypatch.setattr(wuta, "_VOCAB_HISTORY_CACHE", {})
+    snapshot = wuta._get_vocab_snapshot()
+    current = snapshot["term_digests"]
+    changed, added = list(current)[:2]
+    # The old version had a different `changed`, no `added`, and a term removed since.
+    old = {t: d for t, d in current.items() if t != added}
+    old[changed] = "0" * 16
+    old["gone"] = "1" * 16
+    _save_history(OLD_VERSION, old)
+
+    body = wuta.app.test_client().get(f"/api/v1/vocab?since={OLD_VERSION}&fields=hangul").get_json()
+    assert (body["version"], body["since"], body["full"]) == (snapshot["version"], OLD_VERSION, False)
+    assert sorted(t["id"] for t in body["upserted"]) == sorted([changed, added])
+    assert all(t == {"id": t["id"], "hangul": snapshot["api_terms"][t["id"]]["hangul"]} for t in body["upserted"])
+    assert body["removed"] == ["gone"]
+
+    same = wuta.app.test_client().get(f"/api/v1/vocab?since={snapshot['version']}").get_json()
+    assert (same["full"], same["upserted"], same["removed"]) == (False, [], [])
+
+
+def test_pruned_or_unknown_since_falls_back_to_the_full_body(monkeypatch):
+    monkeypatch.setattr(wuta, "_VOCAB_HISTORY_CACHE", {})
+    snapshot = wuta._get_vocab_snapshot()
+    client = wuta.app.test_client()
+    for since in (OLD_VERSION, "not-a-version"):
+        body = client.get(f"/api/v1/vocab?since={since}").get_json()
+        assert body["full"] is True and "since" not in body
+        assert len(body["terms"]) == len(snapshot["api_terms"])
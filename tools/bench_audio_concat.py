@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark bilingual track assembly: MP3 frame splicing vs the pydub/ffmpeg round trip.
+
+Each method runs in its own subprocess so peak RSS is measured independently
+(ffmpeg children are included via RUSAGE_CHILDREN).
+
+    python tools/bench_audio_concat.py                  # offline stub clips
+    python tools/bench_audio_concat.py --provider gtts  # real gTTS clips (network)
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+METHODS = ("frames", "pydub")
+ENGLISH = "The word is Front Kick."
+HANGUL = "앞차기"
+
+
+def _peak_rss_kb() -> dict:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1024 if sys.platform == "darwin" else 1
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    }
+
+
+def _pydub_join(english_mp3: bytes, korean_mp3: bytes, pause_ms: int) -> bytes:
+    """The previous _generate_bilingual_mp3 assembly: decode, add silence, re-encode."""
+    from pydub import AudioSegment
+
+    combined = (
+        AudioSegment.from_mp3(io.BytesIO(english_mp3))
+        + AudioSegment.silent(duration=pause_ms)
+        + AudioSegment.from_mp3(io.BytesIO(korean_mp3))
+    )
+    out = io.BytesIO()
+    combined.export(out, format="mp3")
+    return out.getvalue()
+
+
+def run_child(method: str, provider: str, iterations: int) -> dict:
+    os.environ["WUTA_TTS_PROVIDER"] = provider
+    os.environ["WUTA_AUDIO_PREGENERATE"] = "off"
+    sys.path.insert(0, str(ROOT))
+    import app as wuta
+
+    english_mp3 = wuta._tts_mp3_bytes(ENGLISH, "en")
+    korean_mp3 = wuta._tts_mp3_bytes(HANGUL, "ko", slow=True)
+    baseline = _peak_rss_kb()
+
+    if method == "frames":
+        join = lambda: wuta._concat_mp3_clips([english_mp3, korean_mp3], wuta._AUDIO_PAUSE_MS)
+    else:
+        join = lambda: _pydub_join(english_mp3, korean_mp3, wuta._AUDIO_PAUSE_MS)
+
+    try:
+        out = join()  # warm-up (imports, first ffmpeg spawn)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            out = join()
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        return {"method": method, "error": f"{type(e).__name__}: {e}"}
+
+    peak = _peak_rss_kb()
+    return {
+        "method": method,
+        "iterations": iterations,
+        "ms_per_track": round(elapsed * 1000 / iterations, 3),
+        "output_bytes": len(out or b""),
+        "baseline_rss_kb": baseline["self"],
+        "peak_rss_kb": peak["self"],
+        "peak_child_rss_kb": peak["children"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--provider", choices=("stub", "gtts"), default="stub")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--method", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.method:
+        print(json.dumps(run_child(args.method, args.provider, args.iterations)))
+        return 0
+
+    print(f"provider={args.provider} iterations={args.iterations}")
+    print(f"{'method':<8} {'ms/track':>10} {'bytes':>8} {'rss KiB':>9} {'+ffmpeg KiB':>12}")
+    for method in METHODS:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--method", method, "--provider", args.provider, "--iterations", str(args.iterations)],
+            capture_output=True,
+            text=True,
+        )
+        lines = proc.stdout.strip().splitlines()
+        if proc.returncode != 0 or not lines:
+            print(f"{method:<8} failed: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(lines[-1])
+        if "error" in result:
+            print(f"{method:<8} unavailable ({result['error']})")
+            continue
+        print(
+            f"{method:<8} {result['ms_per_track']:>10} {result['output_bytes']:>8} "
+            f"{result['peak_rss_kb']:>9} {result['peak_child_rss_kb']:>12}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
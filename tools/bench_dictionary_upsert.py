@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark admin dictionary CSV imports: the indexed JSON backend, SQLite, and the old linear scan.
+
+For each size N the dictionary is seeded with N entries, then a CSV of N rows (half
+update existing entries, half are new) goes through the real import job
+(_run_dictionary_import), followed by one single-row save and one delete, as the
+admin page does. Everything runs against temporary files.
+
+    python tools/bench_dictionary_upsert.py                     # 1k / 10k / 100k
+    python tools/bench_dictionary_upsert.py --sizes 5000 --linear-max 5000
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+os.environ["WUTA_AUDIO_PREGENERATE"] = "off"
+sys.path.insert(0, str(ROOT))
+
+import app as wuta  # noqa: E402
+
+
+def _rows(start: int, count: int) -> list[dict]:
+    return [
+        {"english": f"Practice Phrase {n}", "hangul": "연습", "romanization": "yeonseup", "category": "Bench"}
+        for n in range(start, start + count)
+    ]
+
+
+def _linear_upsert(rows: list[dict], now: int) -> tuple[int, int]:
+    """The previous JsonStorage.upsert_dictionary_entries: re-normalize and scan every entry per row."""
+    added = updated = 0
+    payload = wuta._load_custom_dictionary()
+    entries = payload["entries"]
+    for row in rows:
+        k = wuta._normalize_english_key(row["english"])
+        for e in entries:
+            if wuta._normalize_english_key(e.get("english") or "") == k:
+                wuta._apply_dictionary_update(e, row, now)
+                updated += 1
+                break
+        else:
+            entries.append(wuta._new_dictionary_entry(row, now))
+            added += 1
+    wuta._save_custom_dictionary(payload)
+    return added, updated
+
+
+class _LinearStorage(wuta.JsonStorage):
+    def upsert_dictionary_entries(self, rows, now):
+        return _linear_upsert(rows, now)
+
+
+def _write_csv(path: Path, rows: list[dict]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=["english", "hangul", "romanization", "category"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _run(backend: str, size: int, tmp: Path) -> dict:
+    wuta.CUSTOM_DICT_PATH = tmp / "custom_dictionary.json"
+    wuta.JOBS_DIR = tmp / "jobs"
+    wuta._CUSTOM_DICT_CACHE = None
+    if backend == "sqlite":
+        store = wuta.SqliteStorage(tmp / "wuta.db")
+    elif backend == "linear":
+        store = _LinearStorage()
+    else:
+        store = wuta.JsonStorage()
+    wuta._STORAGE = store
+    wuta._HANGUL_INDEX = wuta.HangulIndex(tmp / "dictionary.stamp")
+    now = int(time.time())
+    store.upsert_dictionary_entries(_rows(0, size), now)
+    wuta._CUSTOM_DICT_CACHE = None  # measure a cold start, as after a worker restart
+
+    upload_path = tmp / "import.upload.csv"
+    _write_csv(upload_path, _rows(size // 2, size))
+    job = wuta._create_job("dictionary_import", "admin")
+    started = time.perf_counter()
+    wuta._run_dictionary_import(job, {"upload_path": str(upload_path)})
+    import_s = time.perf_counter() - started
+    assert (job["added"], job["updated"]) == (size - size // 2, size // 2), job
+
+    started = time.perf_counter()
+    store.upsert_dictionary_entries(_rows(0, 1), now + 2)
+    save_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    store.delete_dictionary_entry("practice phrase 1")
+    delete_ms = (time.perf_counter() - started) * 1000
+    return {"import_s": import_s, "save_ms": save_ms, "delete_ms": delete_ms}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--linear-max",
+        type=int,
+        default=2_000,
+        help="largest size to run the O(rows x entries) baseline at (default 2000)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'backend':<8} {'import s':>10} {'rows/s':>10} {'save ms':>9} {'delete ms':>10}")
+    for size in args.sizes:
+        for backend in ("json", "sqlite", "linear"):
+            if backend == "linear" and size > args.linear_max:
+                print(f"{size:>8} {backend:<8} {'skipped (quadratic; raise --linear-max)':>42}")
+                continue
+            with tempfile.TemporaryDirectory() as tmp:
+                result = _run(backend, size, Path(tmp))
+            print(
+                f"{size:>8} {backend:<8} {result['import_s']:>10.3f} {size / result['import_s']:>10.0f} "
+                f"{result['save_ms']:>9.1f} {result['delete_ms']:>10.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Build fingerprinted, minified and precompressed copies of static/ into static/dist/.
+
+    python tools/build_static.py
+
+For every file under static/ (except generated audio) this writes
+static/dist/<dir>/<name>.<hash><ext>, plus .gz and .br siblings when they're smaller
+(.br needs the optional `brotli` package). static/dist/manifest.json maps the original
+names to the hashed ones; app.py uses it to rewrite url_for('static', ...) and to serve
+the precompressed variants with immutable caching. Re-run after changing static files
+(the Dockerfile does this on every build); edited files fall back to their raw URL until then.
+"""
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: gzip-only builds still work
+    brotli = None
+
+ROOT = Path(__file__).resolve().parents[1]
+STATIC_DIR = ROOT / "static"
+DIST_DIR = STATIC_DIR / "dist"
+
+SKIP_DIRS = {("dist",)}
+# Of static/audio only these directories ship with the app; everything else there is
+# generated at runtime (or left over from older layouts) and is not part of the build.
+AUDIO_DIRS = {"sfx"}
+# Already-compressed formats gain nothing from gzip/brotli.
+INCOMPRESSIBLE = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp3", ".zip", ".woff", ".woff2"}
+MIN_COMPRESS_BYTES = 256
+
+# Comments and string literals, matched together so quotes inside comments (and "/*"
+# inside strings) are read correctly.
+_CSS_TOKENS = re.compile(r"(/\*.*?\*/|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')", re.S)
+
+
+def minify_css(text: str) -> str:
+    """Drop comments and insignificant whitespace; string literals are left untouched."""
+    parts = _CSS_TOKENS.split(text)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            if not part.startswith("/*"):
+                out.append(part)
+            continue
+        chunk = re.sub(r"\s+", " ", part)
+        # Not ":" — "a :hover" and "a:hover" are different selectors.
+        chunk = re.sub(r"\s*([{};,>])\s*", r"\1", chunk)
+        out.append(chunk)
+    return "".join(out).replace(";}", "}").strip()
+
+
+def minify_svg(text: str) -> str:
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.S)
+    return re.sub(r">\s+<", "><", text).strip()
+
+
+# JavaScript is only fingerprinted and compressed: safe JS minification needs a real parser.
+MINIFIERS = {".css": minify_css, ".svg": minify_svg}
+
+
+def _skipped(rel: Path) -> bool:
+    if rel.parts[0] == "audio":
+        return len(rel.parts) < 3 or rel.parts[1] not in AUDIO_DIRS
+    return any(rel.parts[: len(prefix)] == prefix for prefix in SKIP_DIRS)
+
+
+def build() -> dict:
+    if DIST_DIR.exists():
+        shutil.rmtree(DIST_DIR)
+    manifest = {"files": {}}
+    totals = {"files": 0, "raw": 0, "min": 0, "gz": 0, "br": 0}
+
+    for src in sorted(STATIC_DIR.rglob("*")):
+        rel = src.relative_to(STATIC_DIR)
+        if not src.is_file() or _skipped(rel) or ".tmp." in src.name:
+            continue
+        raw = src.read_bytes()
+        data = raw
+        minify = MINIFIERS.get(src.suffix.lower())
+        if minify is not None:
+            try:
+                data = minify(raw.decode("utf-8")).encode("utf-8")
+            except UnicodeDecodeError:
+                data = raw
+
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        hashed_rel = rel.with_name(f"{src.stem}.{digest}{src.suffix}")
+        out = DIST_DIR / hashed_rel
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(data)
+
+        stat = src.stat()
+        entry = {
+            "path": f"dist/{hashed_rel.as_posix()}",
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "gzip": False,
+            "br": False,
+        }
+        totals["files"] += 1
+        totals["raw"] += len(raw)
+        totals["min"] += len(data)
+
+        if src.suffix.lower() not in INCOMPRESSIBLE and len(data) >= MIN_COMPRESS_BYTES:
+            # mtime=0 keeps the .gz bytes reproducible across builds.
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < len(data):
+                out.with_name(out.name + ".gz").write_bytes(gz)
+                entry["gzip"] = True
+                totals["gz"] += len(gz)
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                if len(br) < len(data):
+                    out.with_name(out.name + ".br").write_bytes(br)
+                    entry["br"] = True
+                    totals["br"] += len(br)
+
+        manifest["files"][rel.as_posix()] = entry
+
+    (DIST_DIR / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return totals
+
+
+def main() -> int:
+    totals = build()
+    print(f"Built {totals['files']} files into {DIST_DIR.relative_to(ROOT)}/")
+    print(f"  raw {totals['raw']:,} B -> minified {totals['min']:,} B")
+    print(f"  gzip variants {totals['gz']:,} B" + ("" if brotli else " (brotli not installed: no .br files)"))
+    if brotli is not None:
+        print(f"  brotli variants {totals['br']:,} B")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())